@@ -43,8 +43,15 @@ class MineruAdapter:
     def configured(self) -> bool:
         return bool(self.cfg.api_token and self.cfg.base_url)
 
-    async def parse_pdf(self, *, pdf_path: Path, data_id: str) -> MineruParseResult:
-        pdf_bytes = pdf_path.read_bytes()
+    async def parse_pdf(
+        self,
+        *,
+        pdf_path: Path,
+        data_id: str,
+        pdf_bytes: bytes | None = None,
+    ) -> MineruParseResult:
+        if pdf_bytes is None:
+            pdf_bytes = pdf_path.read_bytes()
 
         if not self.configured:
             if not self.cfg.allow_local_fallback:
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import functools
 import html
 import io
+import itertools
 import logging
 import re
 import textwrap
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, BinaryIO, Iterable, Optional
 
 from markdown_it import MarkdownIt
 from mdit_py_plugins.dollarmath import dollarmath_plugin
@@ -32,6 +35,11 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+try:
+    import pymupdf as fitz
+except Exception:  # PyMuPDF-backed overlay/merge paths degrade gracefully.
+    fitz = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +82,37 @@ LOGO_CANDIDATES = (
     Path('frontend/public/logo.png'),
 )
 
+# Static table styles shared across exports; per-export commands are applied on top.
+_COVER_TABLE_STYLE = TableStyle(
+    [
+        ('BOX', (0, 0), (-1, -1), 0.8, colors.HexColor('#CBD5E1')),
+        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E2E8F0')),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F8FAFC')),
+        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#FCFCFD')),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 4.5),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4.5),
+        ('FONTSIZE', (0, 0), (-1, -1), 10.5),
+        ('LEADING', (0, 0), (-1, -1), 16),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#111827')),
+    ]
+)
+_MARKDOWN_TABLE_STYLE = TableStyle(
+    [
+        ('BOX', (0, 0), (-1, -1), 0.6, colors.HexColor('#CBD5E1')),
+        ('INNERGRID', (0, 0), (-1, -1), 0.45, colors.HexColor('#E5E7EB')),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 5),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ]
+)
+_MARKDOWN_TABLE_HEADER_BACKGROUND = colors.HexColor('#F8FAFC')
+_MARKDOWN_TABLE_HEADER_TEXT_COLOR = colors.HexColor('#0F172A')
+
 
 @dataclass(frozen=True)
 class ReportFonts:
@@ -83,12 +122,23 @@ class ReportFonts:
 
 
 _FONTS_CACHE: ReportFonts | None = None
+_REPORT_STYLES_CACHE: dict[ReportFonts, StyleSheet1] = {}
+# Nested-list depths with a prebuilt style in every report stylesheet.
+_MARKDOWN_BULLET_STYLE_DEPTHS = 8
 _MARKDOWN_PARSER: MarkdownIt | None = None
 _FONT_AVAILABLE_CACHE: dict[str, bool] = {}
 _MARKDOWN_EMPHASIS_FONT_CACHE: dict[tuple[str, bool, bool], str] = {}
+_OVERLAY_FONT_TABLE_CACHE: dict[tuple[str, str], dict[tuple[bool, bool, bool, bool, bool], str]] = {}
 _OVERLAY_FONT_FILE_BY_NAME: dict[str, str] = {}
 _FITZ_FONT_METRICS_CACHE: dict[str, Any] = {}
 _FITZ_FONT_METRICS_CACHE_MISS = object()
+_CJK_CHAR_RE = re.compile(
+    '['
+    '\u4e00-\u9fff'  # CJK Unified Ideographs
+    '\u3400-\u4dbf'  # CJK Extension A
+    '\uf900-\ufaff'  # CJK Compatibility Ideographs
+    ']'
+)
 _FITZ_FONT_CANONICAL_ALIASES: dict[str, str] = {
     'helvetica': 'helv',
     'times': 'tiro',
@@ -210,14 +260,22 @@ class AnnotationOverlayItem:
     object_type: str
     severity: Optional[str]
     review_item_id: Optional[str]
-    display_markdown: str
-    display_text: str
+    display_text_raw: str
     color: Optional[str]
     rects: list[dict[str, float]]
     bounding_rect: Optional[dict[str, float]]
 
+    # Normalized on first use: items that are never drawn skip the regex passes.
+    @functools.cached_property
+    def display_markdown(self) -> str:
+        return _normalize_overlay_markdown_source(self.display_text_raw)
 
-@dataclass(frozen=True)
+    @functools.cached_property
+    def display_text(self) -> str:
+        return _markdown_to_overlay_text(self.display_text_raw) or '(no text provided)'
+
+
+@dataclass(frozen=True, slots=True)
 class OverlayStyledRun:
     text: str
     bold: bool = False
@@ -246,6 +304,7 @@ class AnnotationContinuationItem:
     first_continuation_page_index: int | None = None
     first_continuation_rect: tuple[float, float, float, float] | None = None
     next_part_index: int = 1
+    palette: OverlayPalette | None = None
 
 
 @dataclass
@@ -293,8 +352,28 @@ CALLOUT_LANE_GAP = 10.0
 CALLOUT_VERTICAL_GAP = 5.0
 CALLOUT_TEXT_PADDING = 5.0
 
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_OVERLAY_OBJECT_TYPE_MAP: dict[str, str] = {
+    'evidence': 'suggestion',
+    'verification': 'verification',
+    'needs_verification': 'verification',
+    'needs verification': 'verification',
+    'verify': 'verification',
+    'uncertain': 'verification',
+    'issue': 'issue',
+    'suggestion': 'suggestion',
+}
+_OVERLAY_SEVERITIES = frozenset({'critical', 'major', 'minor'})
+_CALLOUT_OBJECT_LABELS: dict[str, str] = {
+    'issue': 'ISSUE',
+    'suggestion': 'SUGGESTION',
+    'verification': 'NEEDS VERIFICATION',
+}
+
 
 def _normalize_newlines(value: str) -> str:
+    if '\r' not in value:
+        return value
     return value.replace('\r\n', '\n').replace('\r', '\n')
 
 
@@ -536,19 +615,11 @@ def _font_available(font_name: str | None) -> bool:
 
 
 def _contains_non_ascii(value: str) -> bool:
-    return any(ord(char) > 127 for char in str(value or ''))
+    return not str(value or '').isascii()
 
 
 def _contains_cjk(value: str) -> bool:
-    for char in str(value or ''):
-        code = ord(char)
-        if (
-            0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
-            or 0x3400 <= code <= 0x4DBF  # CJK Extension A
-            or 0xF900 <= code <= 0xFAFF  # CJK Compatibility Ideographs
-        ):
-            return True
-    return False
+    return _CJK_CHAR_RE.search(str(value or '')) is not None
 
 
 def _register_overlay_measure_font(font_name: str | None, font_path: Path | None) -> None:
@@ -559,10 +630,14 @@ def _register_overlay_measure_font(font_name: str | None, font_path: Path | None
         resolved = str(font_path.resolve())
     except Exception:
         resolved = str(font_path)
-    if not resolved:
+    if not resolved or _OVERLAY_FONT_FILE_BY_NAME.get(token) == resolved:
         return
     _OVERLAY_FONT_FILE_BY_NAME[token] = resolved
     _FITZ_FONT_METRICS_CACHE.pop(token, None)
+    # Widths and wrapped lines are cached by font name, so a name that now points at a
+    # different file invalidates them.
+    _measure_text_width.cache_clear()
+    _wrap_overlay_markdown_lines_cached.cache_clear()
 
 
 def _resolve_fitz_measure_font(font_name: str | None):
@@ -576,9 +651,7 @@ def _resolve_fitz_measure_font(font_name: str | None):
     if cached is not None:
         return cached
 
-    try:
-        import pymupdf as fitz
-    except Exception:
+    if fitz is None:
         return None
 
     candidate_specs: list[tuple[str, str]] = []
@@ -1107,6 +1180,7 @@ def _resolve_report_fonts() -> ReportFonts:
     return _FONTS_CACHE
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_overlay_font_resource() -> tuple[str, Path | None]:
     repo_root = _repo_root()
     chinese_font_path = _first_existing_relative_path(repo_root, FONT_CHINESE_RELATIVE_CANDIDATES)
@@ -1115,6 +1189,7 @@ def _resolve_overlay_font_resource() -> tuple[str, Path | None]:
     return 'china-s', None
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_overlay_mono_font_resource() -> tuple[str, Path | None]:
     for mono_source in FONT_MONO_UNICODE_CANDIDATES:
         mono_path = _safe_file(mono_source)
@@ -1135,7 +1210,6 @@ def _ensure_overlay_font(
         return token
     try:
         page.insert_font(fontname=token, fontfile=str(font_path))
-        _register_overlay_measure_font(token, font_path)
         return token
     except Exception as exc:
         logger.debug('Failed to register overlay font %s from %s: %s', token, font_path, exc)
@@ -1199,6 +1273,16 @@ def _format_datetime(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
 
 
+def _markdown_bullet_depth_style(parent: ParagraphStyle, depth: int) -> ParagraphStyle:
+    return ParagraphStyle(
+        name=f'MarkdownBulletDepth{depth}',
+        parent=parent,
+        leftIndent=parent.leftIndent + (depth * 8),
+        firstLineIndent=parent.firstLineIndent,
+        spaceAfter=parent.spaceAfter,
+    )
+
+
 def _build_styles(fonts: ReportFonts) -> StyleSheet1:
     styles = getSampleStyleSheet()
 
@@ -1355,6 +1439,8 @@ def _build_styles(fonts: ReportFonts) -> StyleSheet1:
             spaceAfter=1.5,
         )
     )
+    for depth in range(_MARKDOWN_BULLET_STYLE_DEPTHS):
+        styles.add(_markdown_bullet_depth_style(styles['MarkdownBullet'], depth))
     styles.add(
         ParagraphStyle(
             name='MarkdownCode',
@@ -1419,6 +1505,29 @@ def _build_styles(fonts: ReportFonts) -> StyleSheet1:
     return styles
 
 
+def _report_styles(fonts: ReportFonts) -> StyleSheet1:
+    # One sheet per font set is shared by every build, including concurrent ones on worker
+    # threads, so it must never be modified after _build_styles returns.
+    cached = _REPORT_STYLES_CACHE.get(fonts)
+    if cached is None:
+        cached = _build_styles(fonts)
+        _REPORT_STYLES_CACHE[fonts] = cached
+    return cached
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_static_paragraph(text: str, style: ParagraphStyle) -> tuple[list, ParagraphStyle]:
+    parsed = Paragraph(text, style)
+    return parsed.frags, parsed.style
+
+
+def _static_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    # Constant markup is parsed once; every build still gets its own Paragraph
+    # because flowables carry per-layout state.
+    frags, parsed_style = _parse_static_paragraph(text, style)
+    return Paragraph(text, parsed_style, frags=frags)
+
+
 def _append_section_header(
     story: list,
     styles: StyleSheet1,
@@ -1479,21 +1588,18 @@ def _append_markdown_report(story: list, styles: StyleSheet1, *, markdown: str)
 
     tokens = _markdown_parser().parse(clean)
 
+    # The shared stylesheet is read-only; unusually deep lists get styles local to this build.
+    deep_list_styles: dict[int, ParagraphStyle] = {}
+
     def _list_style_for_depth(depth: int) -> ParagraphStyle:
         normalized_depth = max(0, int(depth))
-        style_name = f'MarkdownBulletDepth{normalized_depth}'
-        existing = styles.byName.get(style_name)
+        existing = styles.byName.get(f'MarkdownBulletDepth{normalized_depth}')
         if existing is not None:
             return existing
-        parent = styles['MarkdownBullet']
-        style = ParagraphStyle(
-            name=style_name,
-            parent=parent,
-            leftIndent=parent.leftIndent + (normalized_depth * 8),
-            firstLineIndent=parent.firstLineIndent,
-            spaceAfter=parent.spaceAfter,
-        )
-        styles.add(style)
+        style = deep_list_styles.get(normalized_depth)
+        if style is None:
+            style = _markdown_bullet_depth_style(styles['MarkdownBullet'], normalized_depth)
+            deep_list_styles[normalized_depth] = style
         return style
 
     def _append_code_block(content: str, *, lang: str | None = None) -> None:
@@ -1649,23 +1755,17 @@ def _append_markdown_report(story: list, styles: StyleSheet1, *, markdown: str)
                     hAlign='LEFT',
                     repeatRows=1 if header_rows else 0,
                 )
-                table_style = [
-                    ('BOX', (0, 0), (-1, -1), 0.6, colors.HexColor('#CBD5E1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.45, colors.HexColor('#E5E7EB')),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 5),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-                    ('TOPPADDING', (0, 0), (-1, -1), 4),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                ]
+                markdown_table.setStyle(_MARKDOWN_TABLE_STYLE)
+                header_style: list[tuple] = []
                 for row_index in header_rows:
-                    table_style.extend(
+                    header_style.extend(
                         [
-                            ('BACKGROUND', (0, row_index), (-1, row_index), colors.HexColor('#F8FAFC')),
-                            ('TEXTCOLOR', (0, row_index), (-1, row_index), colors.HexColor('#0F172A')),
+                            ('BACKGROUND', (0, row_index), (-1, row_index), _MARKDOWN_TABLE_HEADER_BACKGROUND),
+                            ('TEXTCOLOR', (0, row_index), (-1, row_index), _MARKDOWN_TABLE_HEADER_TEXT_COLOR),
                         ]
                     )
-                markdown_table.setStyle(TableStyle(table_style))
+                if header_style:
+                    markdown_table.setStyle(header_style)
                 story.append(markdown_table)
                 story.append(Spacer(1, 1.5 * mm))
 
@@ -1887,19 +1987,16 @@ def _append_markdown_report(story: list, styles: StyleSheet1, *, markdown: str)
         cursor += 1
 
 
-def _merge_with_pypdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes) -> bytes | None:
+def _merge_with_pypdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes, output: BinaryIO) -> bool:
     try:
         from pypdf import PdfReader, PdfWriter
     except Exception as exc:
         logger.warning('pypdf unavailable for source PDF appendix merge: %s', exc)
-        return None
+        return False
 
     try:
         writer = PdfWriter()
-
-        report_reader = PdfReader(io.BytesIO(report_pdf_bytes))
-        for page in report_reader.pages:
-            writer.add_page(page)
+        writer.append(PdfReader(io.BytesIO(report_pdf_bytes)), import_outline=False)
 
         source_reader = PdfReader(io.BytesIO(source_pdf_bytes))
         if getattr(source_reader, 'is_encrypted', False):
@@ -1907,25 +2004,20 @@ def _merge_with_pypdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes) -> bytes
                 source_reader.decrypt('')
             except Exception:
                 logger.warning('Source PDF is encrypted; skip source appendix merge.')
-                return None
-
-        for page in source_reader.pages:
-            writer.add_page(page)
+                return False
 
-        output = io.BytesIO()
+        writer.append(source_reader, import_outline=False)
         writer.write(output)
-        return output.getvalue()
+        return True
     except Exception as exc:
         logger.warning('Failed to merge source PDF with pypdf: %s', exc)
-        return None
+        return False
 
 
-def _merge_with_pymupdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes) -> bytes | None:
-    try:
-        import pymupdf as fitz
-    except Exception as exc:
-        logger.warning('PyMuPDF unavailable for source PDF appendix merge: %s', exc)
-        return None
+def _merge_with_pymupdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes, output: BinaryIO) -> bool:
+    if fitz is None:
+        logger.warning('PyMuPDF unavailable for source PDF appendix merge.')
+        return False
 
     report_doc = None
     source_doc = None
@@ -1933,21 +2025,16 @@ def _merge_with_pymupdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes) -> byt
         report_doc = fitz.open(stream=report_pdf_bytes, filetype='pdf')
         source_doc = fitz.open(stream=source_pdf_bytes, filetype='pdf')
 
-        if source_doc.is_encrypted:
-            authenticated = False
-            try:
-                authenticated = bool(source_doc.authenticate(''))
-            except Exception:
-                authenticated = False
-            if not authenticated:
-                logger.warning('Source PDF is encrypted; skip source appendix merge.')
-                return None
+        if source_doc.is_encrypted and not source_doc.authenticate(''):
+            logger.warning('Source PDF is encrypted; skip source appendix merge.')
+            return False
 
         report_doc.insert_pdf(source_doc)
-        return report_doc.tobytes(garbage=3, deflate=True)
+        report_doc.save(output, garbage=3, deflate=True)
+        return True
     except Exception as exc:
         logger.warning('Failed to merge source PDF with PyMuPDF: %s', exc)
-        return None
+        return False
     finally:
         if source_doc is not None:
             source_doc.close()
@@ -1956,26 +2043,20 @@ def _merge_with_pymupdf(report_pdf_bytes: bytes, source_pdf_bytes: bytes) -> byt
 
 
 def _normalize_overlay_object_type(value: object) -> str:
-    token = str(value or '').strip().lower()
-    if token == 'evidence':
-        return 'suggestion'
-    if token in {'verification', 'needs_verification', 'needs verification', 'verify', 'uncertain'}:
-        return 'verification'
-    if token in {'issue', 'suggestion'}:
-        return token
-    return 'suggestion'
+    return _OVERLAY_OBJECT_TYPE_MAP.get(str(value or '').strip().lower(), 'suggestion')
 
 
 def _parse_hex_color(value: object) -> tuple[float, float, float] | None:
     token = str(value or '').strip()
-    if not re.fullmatch(r'#?[0-9a-fA-F]{6}', token):
+    digits = token[1:] if token[:1] == '#' else token
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
         return None
-    if token.startswith('#'):
-        token = token[1:]
-    r = int(token[0:2], 16) / 255.0
-    g = int(token[2:4], 16) / 255.0
-    b = int(token[4:6], 16) / 255.0
-    return (r, g, b)
+    packed = int(digits, 16)
+    return (
+        ((packed >> 16) & 0xFF) / 255.0,
+        ((packed >> 8) & 0xFF) / 255.0,
+        (packed & 0xFF) / 255.0,
+    )
 
 
 def _coerce_overlay_rect(raw: object) -> dict[str, float] | None:
@@ -2071,45 +2152,44 @@ def _parse_overlay_inline_runs(line: str) -> list[OverlayStyledRun]:
 
     runs: list[OverlayStyledRun] = []
     buffer: list[str] = []
+    # Text for the run being assembled; adjacent flushes that share a style are
+    # merged here so each run is constructed once.
+    pending_parts: list[str] = []
+    pending_style: tuple[bool, bool, bool, bool] | None = None
     bold = False
     italic = False
     strike = False
     code = False
     cursor = 0
 
+    def _emit_pending() -> None:
+        if pending_style is None or not pending_parts:
+            return
+        run_bold, run_italic, run_strike, run_code = pending_style
+        runs.append(
+            OverlayStyledRun(
+                text=''.join(pending_parts),
+                bold=run_bold,
+                italic=run_italic,
+                strike=run_strike,
+                code=run_code,
+            )
+        )
+
     def _flush_buffer() -> None:
-        nonlocal buffer
+        nonlocal buffer, pending_parts, pending_style
         if not buffer:
             return
         text = ''.join(buffer)
         buffer = []
         if not text:
             return
-        if (
-            runs
-            and runs[-1].bold == bold
-            and runs[-1].italic == italic
-            and runs[-1].strike == strike
-            and runs[-1].code == code
-        ):
-            previous = runs[-1]
-            runs[-1] = OverlayStyledRun(
-                text=f'{previous.text}{text}',
-                bold=previous.bold,
-                italic=previous.italic,
-                strike=previous.strike,
-                code=previous.code,
-            )
-            return
-        runs.append(
-            OverlayStyledRun(
-                text=text,
-                bold=bold,
-                italic=italic,
-                strike=strike,
-                code=code,
-            )
-        )
+        style = (bold, italic, strike, code)
+        if style != pending_style:
+            _emit_pending()
+            pending_parts = []
+            pending_style = style
+        pending_parts.append(text)
 
     while cursor < len(source):
         if source.startswith('\\', cursor) and cursor + 1 < len(source):
@@ -2156,38 +2236,81 @@ def _parse_overlay_inline_runs(line: str) -> list[OverlayStyledRun]:
         cursor += 1
 
     _flush_buffer()
+    _emit_pending()
     return runs
 
 
-def _overlay_run_font_name(
-    run: OverlayStyledRun,
+def _resolve_overlay_run_font_name(
     *,
+    bold: bool,
+    italic: bool,
+    code: bool,
+    has_cjk: bool,
+    has_non_ascii: bool,
     base_font: str,
     mono_font: str,
 ) -> str:
-    if run.code:
+    if code:
         # Keep CJK in base font; route non-CJK code/formula text to unicode mono
         # so math symbols (e.g., α, β, ≤, ≥) do not render as tofu boxes.
-        if _contains_cjk(run.text):
+        if has_cjk:
             return base_font
         return mono_font if mono_font else base_font
 
-    if not run.bold and not run.italic:
+    if not bold and not italic:
         return base_font
 
     emphasis_font = _resolve_markdown_emphasis_font(
         base_font,
-        bold=run.bold,
-        italic=run.italic,
+        bold=bold,
+        italic=italic,
     )
-    if (
-        _contains_non_ascii(run.text)
-        and str(emphasis_font).lower().startswith('helvetica')
-    ):
+    if has_non_ascii and str(emphasis_font).lower().startswith('helvetica'):
         return base_font
     return emphasis_font or base_font
 
 
+def _overlay_font_table(
+    base_font: str,
+    mono_font: str,
+) -> dict[tuple[bool, bool, bool, bool, bool], str]:
+    cache_key = (base_font, mono_font)
+    cached = _OVERLAY_FONT_TABLE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    table: dict[tuple[bool, bool, bool, bool, bool], str] = {}
+    for flags in itertools.product((False, True), repeat=5):
+        bold, italic, code, has_cjk, has_non_ascii = flags
+        table[flags] = _resolve_overlay_run_font_name(
+            bold=bold,
+            italic=italic,
+            code=code,
+            has_cjk=has_cjk,
+            has_non_ascii=has_non_ascii,
+            base_font=base_font,
+            mono_font=mono_font,
+        )
+    _OVERLAY_FONT_TABLE_CACHE[cache_key] = table
+    return table
+
+
+def _overlay_run_font_name(
+    run: OverlayStyledRun,
+    *,
+    base_font: str,
+    mono_font: str,
+    font_table: dict[tuple[bool, bool, bool, bool, bool], str] | None = None,
+) -> str:
+    if font_table is None:
+        font_table = _overlay_font_table(base_font, mono_font)
+    code = run.code
+    # Only probe the text when the flag can change the resolved font.
+    has_cjk = code and _contains_cjk(run.text)
+    has_non_ascii = not code and (run.bold or run.italic) and _contains_non_ascii(run.text)
+    return font_table[(run.bold, run.italic, code, has_cjk, has_non_ascii)]
+
+
 def _wrap_overlay_markdown_lines(
     markdown: str,
     *,
@@ -2196,15 +2319,34 @@ def _wrap_overlay_markdown_lines(
     mono_font: str,
     font_size: float,
 ) -> list[list[OverlayStyledRun]]:
+    wrapped = _wrap_overlay_markdown_lines_cached(
+        str(markdown or ''),
+        float(max_width_points),
+        base_font,
+        mono_font,
+        float(font_size),
+    )
+    return [list(line) for line in wrapped]
+
+
+@functools.lru_cache(maxsize=2048)
+def _wrap_overlay_markdown_lines_cached(
+    markdown: str,
+    max_width_points: float,
+    base_font: str,
+    mono_font: str,
+    font_size: float,
+) -> tuple[tuple[OverlayStyledRun, ...], ...]:
     normalized = _normalize_overlay_markdown_source(markdown)
     if not normalized:
-        return [[OverlayStyledRun(text='(no text provided)')]]
+        return ((OverlayStyledRun(text='(no text provided)'),),)
 
-    wrapped_lines: list[list[OverlayStyledRun]] = []
+    font_table = _overlay_font_table(base_font, mono_font)
+    wrapped_lines: list[tuple[OverlayStyledRun, ...]] = []
     for raw_line in normalized.split('\n'):
         if not raw_line.strip():
             if wrapped_lines and wrapped_lines[-1]:
-                wrapped_lines.append([])
+                wrapped_lines.append(())
             continue
 
         line_runs = _parse_overlay_inline_runs(raw_line)
@@ -2238,7 +2380,7 @@ def _wrap_overlay_markdown_lines(
             while current_line and current_line[-1].text.isspace():
                 current_line.pop()
             if current_line:
-                wrapped_lines.append(list(current_line))
+                wrapped_lines.append(tuple(current_line))
             current_line = []
             current_width = 0.0
 
@@ -2253,6 +2395,7 @@ def _wrap_overlay_markdown_lines(
                 token_run,
                 base_font=base_font,
                 mono_font=mono_font,
+                font_table=font_table,
             )
             token_width = _measure_text_width(
                 token_text,
@@ -2280,6 +2423,7 @@ def _wrap_overlay_markdown_lines(
                     token_run,
                     base_font=base_font,
                     mono_font=mono_font,
+                    font_table=font_table,
                 )
                 token_width = _measure_text_width(
                     token_run.text,
@@ -2325,7 +2469,7 @@ def _wrap_overlay_markdown_lines(
         if current_line:
             _flush_current_line()
 
-    return wrapped_lines or [[OverlayStyledRun(text='(no text provided)')]]
+    return tuple(wrapped_lines) or ((OverlayStyledRun(text='(no text provided)'),),)
 
 
 def _normalize_overlay_item(raw: dict[str, Any]) -> AnnotationOverlayItem | None:
@@ -2352,11 +2496,9 @@ def _normalize_overlay_item(raw: dict[str, Any]) -> AnnotationOverlayItem | None
         or raw.get('content_text')
         or ''
     ).strip()
-    display_markdown = _normalize_overlay_markdown_source(display_text_raw)
-    display_text = _markdown_to_overlay_text(display_text_raw) or '(no text provided)'
 
     severity = str(raw.get('severity') or '').strip().lower() or None
-    if severity not in {'critical', 'major', 'minor'}:
+    if severity not in _OVERLAY_SEVERITIES:
         severity = None
 
     review_item_id = str(raw.get('review_item_id') or '').strip() or None
@@ -2369,8 +2511,7 @@ def _normalize_overlay_item(raw: dict[str, Any]) -> AnnotationOverlayItem | None
         object_type=_normalize_overlay_object_type(raw.get('object_type')),
         severity=severity,
         review_item_id=review_item_id,
-        display_markdown=display_markdown,
-        display_text=display_text,
+        display_text_raw=display_text_raw,
         color=str(raw.get('color') or '').strip() or None,
         rects=rects,
         bounding_rect=bounding_rect,
@@ -2405,10 +2546,7 @@ def _normalize_overlay_items(raw_items: list[dict[str, Any]] | None) -> list[Ann
     return normalized
 
 
-def _to_page_rect(page, rect: dict[str, float]):
-    import pymupdf as fitz
-
-    page_rect = page.rect
+def _to_page_coords(page_rect, rect: dict[str, float]) -> tuple[float, float, float, float]:
     width_ref = rect.get('width', 100.0) or 100.0
     height_ref = rect.get('height', 100.0) or 100.0
 
@@ -2416,9 +2554,10 @@ def _to_page_rect(page, rect: dict[str, float]):
     y1 = page_rect.y0 + (rect['y1'] / height_ref) * page_rect.height
     x2 = page_rect.x0 + (rect['x2'] / width_ref) * page_rect.width
     y2 = page_rect.y0 + (rect['y2'] / height_ref) * page_rect.height
-    return fitz.Rect(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
 
 
+@functools.lru_cache(maxsize=16384)
 def _measure_text_width(
     text: str,
     *,
@@ -2430,16 +2569,15 @@ def _measure_text_width(
         return 0.0
     normalized_font_size = max(1.0, float(font_size))
 
-    try:
-        import pymupdf as fitz
-
-        measured = float(
-            fitz.get_text_length(text_value, fontname=font_name, fontsize=normalized_font_size)
-        )
-        if measured > 0:
-            return measured
-    except Exception:
-        pass
+    if fitz is not None:
+        try:
+            measured = float(
+                fitz.get_text_length(text_value, fontname=font_name, fontsize=normalized_font_size)
+            )
+            if measured > 0:
+                return measured
+        except Exception:
+            pass
 
     fitz_font = _resolve_fitz_measure_font(font_name)
     if fitz_font is not None:
@@ -2469,12 +2607,7 @@ def _measure_text_width(
     if width > 0:
         return width
 
-    try:
-        import pymupdf as fitz
-
-        return float(len(text_value)) * normalized_font_size * 0.52
-    except Exception:
-        return float(len(text_value)) * normalized_font_size * 0.52
+    return float(len(text_value)) * normalized_font_size * 0.52
 
 
 def _split_token_by_width(
@@ -2516,13 +2649,7 @@ def _build_callout_header(
     if marker:
         parts.append(marker)
 
-    object_label = {
-        'issue': 'ISSUE',
-        'suggestion': 'SUGGESTION',
-        'verification': 'NEEDS VERIFICATION',
-    }.get(item.object_type, item.object_type.upper())
-    label = object_label
-    parts.append(label)
+    parts.append(_CALLOUT_OBJECT_LABELS.get(item.object_type) or item.object_type.upper())
     if item.severity:
         parts.append(item.severity.upper())
     if item.review_item_id:
@@ -2535,7 +2662,8 @@ def _build_callout_header(
 
 
 def _draw_callout(
-    page,
+    shape,
+    writer,
     *,
     box_rect,
     header_text: str,
@@ -2545,37 +2673,34 @@ def _draw_callout(
     font_name: str,
     mono_font_name: str = 'cour',
 ) -> None:
-    import pymupdf as fitz
-
-    page.draw_rect(
-        box_rect,
+    # Boxes and the header go onto the page's shared Shape, styled body runs onto
+    # its TextWriter; the caller commits the shape before writing the text.
+    shape.draw_rect(box_rect)
+    shape.finish(
         color=palette.callout_border,
         fill=palette.callout_fill,
         width=0.9,
         fill_opacity=0.92,
         stroke_opacity=0.95,
-        overlay=True,
     )
 
     label_rect = box_rect + (0, 0, 0, -(box_rect.height - CALLOUT_LABEL_HEIGHT))
-    page.draw_rect(
-        label_rect,
+    shape.draw_rect(label_rect)
+    shape.finish(
         color=palette.callout_border,
         fill=palette.label_fill,
         width=0,
         fill_opacity=0.95,
         stroke_opacity=0.95,
-        overlay=True,
     )
 
-    page.insert_textbox(
+    shape.insert_textbox(
         label_rect + (CALLOUT_TEXT_PADDING, 1, -CALLOUT_TEXT_PADDING, 0),
         header_text,
         fontsize=8.0,
         color=(0.1, 0.1, 0.1),
         fontname=font_name,
         align=0,
-        overlay=True,
     )
 
     text_rect = box_rect + (
@@ -2585,17 +2710,18 @@ def _draw_callout(
         -CALLOUT_TEXT_PADDING,
     )
     if styled_lines is None:
-        page.insert_textbox(
+        shape.insert_textbox(
             text_rect,
             '\n'.join(lines),
             fontsize=7.6,
             color=(0.08, 0.08, 0.08),
             fontname=font_name,
             align=0,
-            overlay=True,
         )
         return
 
+    font_table = _overlay_font_table(font_name, mono_font_name)
+    strike_segments: list[tuple[tuple[float, float], tuple[float, float]]] = []
     cursor_y = float(text_rect.y0) + 7.6
     max_y = float(text_rect.y1)
     for line_runs in styled_lines:
@@ -2613,45 +2739,34 @@ def _draw_callout(
                 run,
                 base_font=font_name,
                 mono_font=mono_font_name,
+                font_table=font_table,
             )
+            run_fitz_font = _resolve_fitz_measure_font(run_font)
+            if run_fitz_font is None:
+                run_font = font_name
+                run_fitz_font = _resolve_fitz_measure_font(font_name)
+            if run_fitz_font is None:
+                continue
             try:
-                page.insert_text(
-                    fitz.Point(cursor_x, cursor_y),
-                    run_text,
-                    fontsize=7.6,
-                    color=(0.08, 0.08, 0.08),
-                    fontname=run_font,
-                    overlay=True,
-                )
+                writer.append((cursor_x, cursor_y), run_text, font=run_fitz_font, fontsize=7.6)
             except Exception:
-                page.insert_text(
-                    fitz.Point(cursor_x, cursor_y),
-                    run_text,
-                    fontsize=7.6,
-                    color=(0.08, 0.08, 0.08),
-                    fontname=font_name,
-                    overlay=True,
-                )
-                run_font = font_name
+                base_fitz_font = _resolve_fitz_measure_font(font_name)
+                if base_fitz_font is None or base_fitz_font is run_fitz_font:
+                    continue
+                writer.append((cursor_x, cursor_y), run_text, font=base_fitz_font, fontsize=7.6)
 
-            run_width = _measure_text_width(
-                run_text,
-                font_name=run_font,
-                font_size=7.6,
-            )
+            run_width = max(0.0, float(writer.last_point.x) - cursor_x)
             if run.strike and run_text.strip():
                 strike_y = cursor_y - (7.6 * 0.32)
-                page.draw_line(
-                    (cursor_x, strike_y),
-                    (cursor_x + run_width, strike_y),
-                    color=(0.08, 0.08, 0.08),
-                    width=0.72,
-                    stroke_opacity=0.95,
-                    overlay=True,
-                )
+                strike_segments.append(((cursor_x, strike_y), (cursor_x + run_width, strike_y)))
             cursor_x += run_width
         cursor_y += CALLOUT_LINE_HEIGHT
 
+    if strike_segments:
+        for start, end in strike_segments:
+            shape.draw_line(start, end)
+        shape.finish(color=(0.08, 0.08, 0.08), width=0.72, closePath=False, stroke_opacity=0.95)
+
 
 def _draw_page_identity_tag(
     page,
@@ -2659,8 +2774,6 @@ def _draw_page_identity_tag(
     source_page_number: int,
     continuation_page_no: int | None = None,
 ) -> None:
-    import pymupdf as fitz
-
     page_rect = page.rect
     margin_x = 10.0
     margin_y = 8.0
@@ -2685,7 +2798,7 @@ def _draw_page_identity_tag(
         stroke_opacity=0.95,
         overlay=True,
     )
-    page.insert_textbox(
+    spare_height = page.insert_textbox(
         tag_rect + (5.0, 2.0, -5.0, -1.0),
         label,
         fontsize=7.8,
@@ -2694,27 +2807,109 @@ def _draw_page_identity_tag(
         align=1,
         overlay=True,
     )
-    page.insert_text(
-        fitz.Point(tag_rect.x0 + 6.0, tag_rect.y1 - 4.0),
-        label,
-        fontsize=7.6,
-        color=(0.20, 0.22, 0.24),
-        fontname='helv',
-        overlay=True,
-    )
+    if spare_height < 0:
+        # The textbox draws nothing when the label does not fit (e.g. continuation labels).
+        page.insert_text(
+            fitz.Point(tag_rect.x0 + 6.0, tag_rect.y1 - 4.0),
+            label,
+            fontsize=7.6,
+            color=(0.20, 0.22, 0.24),
+            fontname='helv',
+            overlay=True,
+        )
 
 
 def _clamp(value: float, lower: float, upper: float) -> float:
     return max(lower, min(upper, value))
 
 
+class _MergedIntervals:
+    """Vertical ``(top, bottom)`` intervals kept sorted and merged on insert."""
+
+    __slots__ = ('_bottoms', '_tops')
+
+    def __init__(self) -> None:
+        self._tops: list[float] = []
+        self._bottoms: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._tops)
+
+    def __iter__(self):
+        return zip(self._tops, self._bottoms)
+
+    def insert(self, top: float, bottom: float) -> None:
+        if bottom <= top:
+            return
+        tops = self._tops
+        bottoms = self._bottoms
+        start = bisect_left(tops, top)
+        if start > 0 and bottoms[start - 1] >= top:
+            start -= 1
+            top = tops[start]
+            bottom = max(bottom, bottoms[start])
+        end = start
+        while end < len(tops) and tops[end] <= bottom:
+            bottom = max(bottom, bottoms[end])
+            end += 1
+        tops[start:end] = [top]
+        bottoms[start:end] = [bottom]
+
+    def nearest_free_top(
+        self,
+        *,
+        lane_top: float,
+        lane_bottom: float,
+        preferred: float,
+        box_height: float,
+        gap: float,
+    ) -> float | None:
+        tops = self._tops
+        bottoms = self._bottoms
+        # Intervals overlapping the lane form one contiguous slice [lo, hi); free
+        # range ``index`` sits between intervals ``index - 1`` and ``index``.
+        lo = bisect_right(bottoms, lane_top)
+        hi = bisect_left(tops, lane_bottom, lo)
+        pivot = bisect_right(tops, preferred, lo, hi)
+
+        def _free_range(index: int) -> tuple[float, float]:
+            start = lane_top if index == lo else min(bottoms[index - 1], lane_bottom) + gap
+            end = lane_bottom if index == hi else max(tops[index], lane_top) - gap
+            return start, end
+
+        # Ranges before the pivot lie above ``preferred``; the nearest fitting one wins.
+        best_top: float | None = None
+        best_distance: float | None = None
+        for index in range(pivot - 1, lo - 1, -1):
+            start, end = _free_range(index)
+            if end - start >= box_height:
+                best_top = _clamp(preferred, start, end - box_height)
+                best_distance = preferred - best_top
+                break
+
+        # From the pivot on, distances only grow once a range starts below ``preferred``.
+        for index in range(pivot, hi + 1):
+            start, end = _free_range(index)
+            if end - start < box_height:
+                continue
+            candidate = _clamp(preferred, start, end - box_height)
+            distance = abs(candidate - preferred)
+            if best_distance is None or distance < best_distance:
+                best_top = candidate
+                best_distance = distance
+            if start >= preferred or distance == 0:
+                break
+
+        return best_top
+
+
 def _resolve_callout_slots(
     *,
     lane_top: float,
     lane_bottom: float,
     preferred_top: float,
     box_height: float,
-    occupied: list[tuple[float, float]],
+    occupied: _MergedIntervals,
     gap: float,
 ) -> float | None:
     available_height = lane_bottom - lane_top
@@ -2725,50 +2920,16 @@ def _resolve_callout_slots(
     max_top = lane_bottom - box_height
     preferred = _clamp(preferred_top, min_top, max_top)
 
-    normalized: list[tuple[float, float]] = []
-    for occ_top, occ_bottom in occupied:
-        top = _clamp(occ_top, lane_top, lane_bottom)
-        bottom = _clamp(occ_bottom, lane_top, lane_bottom)
-        if bottom <= top:
-            continue
-        normalized.append((top, bottom))
-
-    if not normalized:
+    if not occupied:
         return preferred
 
-    normalized.sort(key=lambda pair: pair[0])
-
-    merged: list[list[float]] = []
-    for top, bottom in normalized:
-        if not merged or top > merged[-1][1]:
-            merged.append([top, bottom])
-            continue
-        merged[-1][1] = max(merged[-1][1], bottom)
-
-    free_ranges: list[tuple[float, float]] = []
-    cursor = lane_top
-    for top, bottom in merged:
-        free_end = top - gap
-        if free_end - cursor >= box_height:
-            free_ranges.append((cursor, free_end))
-        cursor = max(cursor, bottom + gap)
-
-    if lane_bottom - cursor >= box_height:
-        free_ranges.append((cursor, lane_bottom))
-
-    if not free_ranges:
-        return None
-
-    best_top: float | None = None
-    best_distance: float | None = None
-    for free_start, free_end in free_ranges:
-        candidate = _clamp(preferred, free_start, free_end - box_height)
-        distance = abs(candidate - preferred)
-        if best_top is None or best_distance is None or distance < best_distance:
-            best_top = candidate
-            best_distance = distance
-
-    return best_top
+    return occupied.nearest_free_top(
+        lane_top=lane_top,
+        lane_bottom=lane_bottom,
+        preferred=preferred,
+        box_height=box_height,
+        gap=gap,
+    )
 
 
 def _estimate_callout_box_height(line_count: int) -> float:
@@ -2787,7 +2948,7 @@ def _find_best_callout_layout(
     preferred_top: float,
     lane_top: float,
     lane_bottom: float,
-    occupied: list[tuple[float, float]],
+    occupied: _MergedIntervals,
 ) -> tuple[int, float | None]:
     if total_lines <= 0:
         return 0, None
@@ -2797,10 +2958,22 @@ def _find_best_callout_layout(
     if max_lines <= 0:
         return 0, None
 
+    # Most callouts fit whole; try that before bisecting on the line count.
+    top = _resolve_callout_slots(
+        lane_top=lane_top,
+        lane_bottom=lane_bottom,
+        preferred_top=preferred_top,
+        box_height=_estimate_callout_box_height(max_lines),
+        occupied=occupied,
+        gap=CALLOUT_VERTICAL_GAP,
+    )
+    if top is not None:
+        return max_lines, top
+
     best_lines = 0
     best_top: float | None = None
     low = 1
-    high = max_lines
+    high = max_lines - 1
 
     while low <= high:
         mid = (low + high) // 2
@@ -2833,8 +3006,6 @@ def _draw_annotation_overlay_on_page(
     if not items:
         return []
 
-    import pymupdf as fitz
-
     overlay_mono_font_token, overlay_mono_font_path = _resolve_overlay_mono_font_resource()
     overlay_font_name = _ensure_overlay_font(
         page,
@@ -2862,6 +3033,7 @@ def _draw_annotation_overlay_on_page(
 
     lane_top = page_rect.y0 + margin_y
     lane_bottom = page_rect.y1 - margin_y
+    clip_x0 = page_rect.x0 + margin_x
 
     sorted_items = sorted(
         items,
@@ -2876,29 +3048,32 @@ def _draw_annotation_overlay_on_page(
     for annotation_index, item in enumerate(sorted_items, start=1):
         marker = f'#P{item.page_number:02d}-A{annotation_index:02d}'
         palette = _overlay_palette(item)
-        highlight_rects = [_to_page_rect(page, rect) for rect in item.rects]
-        highlight_rects = [rect for rect in highlight_rects if rect.get_area() > 0]
-        if not highlight_rects:
-            continue
-
-        clipped_highlight_rects: list[fitz.Rect] = []
-        for rect in highlight_rects:
-            clipped = fitz.Rect(
-                _clamp(rect.x0, page_rect.x0 + margin_x, highlight_max_x),
-                _clamp(rect.y0, page_rect.y0 + margin_y, page_rect.y1 - margin_y),
-                _clamp(rect.x1, page_rect.x0 + margin_x, highlight_max_x),
-                _clamp(rect.y1, page_rect.y0 + margin_y, page_rect.y1 - margin_y),
-            )
-            if clipped.x1 <= clipped.x0 or clipped.y1 <= clipped.y0:
+        # Clip in plain floats and only build fitz.Rect objects for survivors.
+        clipped_coords: list[tuple[float, float, float, float]] = []
+        for rect in item.rects:
+            x0, y0, x1, y1 = _to_page_coords(page_rect, rect)
+            if x1 <= x0 or y1 <= y0:
                 continue
-            clipped_highlight_rects.append(clipped)
+            # Inlined _clamp; with inverted bounds both edges collapse to the
+            # lower bound, so the emptiness check below still drops the rect.
+            x0 = max(clip_x0, min(highlight_max_x, x0))
+            y0 = max(lane_top, min(lane_bottom, y0))
+            x1 = max(clip_x0, min(highlight_max_x, x1))
+            y1 = max(lane_top, min(lane_bottom, y1))
+            if x1 <= x0 or y1 <= y0:
+                continue
+            clipped_coords.append((x0, y0, x1, y1))
 
-        if not clipped_highlight_rects:
+        if not clipped_coords:
             continue
 
-        union_rect = clipped_highlight_rects[0]
-        for rect in clipped_highlight_rects[1:]:
-            union_rect |= rect
+        clipped_highlight_rects = [fitz.Rect(coords) for coords in clipped_coords]
+        union_rect = fitz.Rect(
+            min(coords[0] for coords in clipped_coords),
+            min(coords[1] for coords in clipped_coords),
+            max(coords[2] for coords in clipped_coords),
+            max(coords[3] for coords in clipped_coords),
+        )
 
         anchor_x = _clamp(union_rect.x1, page_rect.x0 + margin_x, highlight_max_x)
         anchor_y = _clamp((union_rect.y0 + union_rect.y1) / 2.0, lane_top, lane_bottom)
@@ -2946,7 +3121,7 @@ def _draw_annotation_overlay_on_page(
     if not prepared_items:
         return []
 
-    simulated_occupied: list[tuple[float, float]] = []
+    simulated_occupied = _MergedIntervals()
     page_overflow_mode = False
     for prepared in prepared_items:
         full_lines_to_draw, full_box_top = _find_best_callout_layout(
@@ -2960,41 +3135,42 @@ def _draw_annotation_overlay_on_page(
             page_overflow_mode = True
             break
         full_box_height = _estimate_callout_box_height(full_lines_to_draw)
-        simulated_occupied.append((full_box_top, full_box_top + full_box_height))
-        simulated_occupied.sort(key=lambda pair: pair[0])
+        simulated_occupied.insert(full_box_top, full_box_top + full_box_height)
 
-    right_occupied: list[tuple[float, float]] = []
+    right_occupied = _MergedIntervals()
     continuation_items: list[AnnotationContinuationItem] = []
 
+    # All vector drawing for the page is queued on one Shape and committed once;
+    # every draw_* / insert_* call on the page would commit (and re-scan the
+    # content stream) on its own.
+    shape = page.new_shape()
+    writer = fitz.TextWriter(page.rect)
     for prepared in prepared_items:
         for clipped in prepared.clipped_highlight_rects:
-            page.draw_rect(
-                clipped,
-                color=prepared.palette.stroke,
-                fill=prepared.palette.fill,
-                width=0.8,
-                stroke_opacity=0.95,
-                fill_opacity=0.35,
-                overlay=True,
-            )
+            shape.draw_rect(clipped)
+        shape.finish(
+            color=prepared.palette.stroke,
+            fill=prepared.palette.fill,
+            width=0.8,
+            stroke_opacity=0.95,
+            fill_opacity=0.35,
+        )
 
-        page.draw_rect(
-            prepared.marker_rect,
+        shape.draw_rect(prepared.marker_rect)
+        shape.finish(
             color=prepared.palette.callout_border,
             fill=prepared.palette.label_fill,
             width=0.6,
             fill_opacity=0.95,
             stroke_opacity=0.95,
-            overlay=True,
         )
-        page.insert_textbox(
+        shape.insert_textbox(
             prepared.marker_rect + (3.0, 1.2, -3.0, -1.0),
             prepared.marker,
             fontsize=6.8,
             color=(0.16, 0.16, 0.16),
             fontname=overlay_font_name,
             align=0,
-            overlay=True,
         )
 
         if page_overflow_mode:
@@ -3014,8 +3190,7 @@ def _draw_annotation_overlay_on_page(
                 visible_index_lines = index_lines[:index_lines_to_draw]
                 index_box_height = _estimate_callout_box_height(len(visible_index_lines))
                 index_box_bottom = index_box_top + index_box_height
-                right_occupied.append((index_box_top, index_box_bottom))
-                right_occupied.sort(key=lambda pair: pair[0])
+                right_occupied.insert(index_box_top, index_box_bottom)
 
                 index_box_rect = fitz.Rect(
                     right_lane_left,
@@ -3023,19 +3198,22 @@ def _draw_annotation_overlay_on_page(
                     right_lane_left + lane_width,
                     index_box_bottom,
                 )
-                page.draw_line(
+                shape.draw_line(
                     (prepared.anchor_x + 1.0, prepared.anchor_y),
                     (
                         index_box_rect.x0 - 2.0,
                         _clamp(prepared.anchor_y, index_box_rect.y0 + 6.0, index_box_rect.y1 - 6.0),
                     ),
+                )
+                shape.finish(
                     color=prepared.palette.callout_border,
                     width=0.8,
+                    closePath=False,
                     stroke_opacity=0.9,
-                    overlay=True,
                 )
                 _draw_callout(
-                    page,
+                    shape,
+                    writer,
                     box_rect=index_box_rect,
                     header_text=_build_callout_header(
                         prepared.item,
@@ -3053,7 +3231,7 @@ def _draw_annotation_overlay_on_page(
                 AnnotationContinuationItem(
                     marker=prepared.marker,
                     item=prepared.item,
-                    remaining_lines=[list(line) for line in prepared.styled_lines],
+                    remaining_lines=[],
                     source_marker_rect=(
                         float(link_rect.x0),
                         float(link_rect.y0),
@@ -3061,6 +3239,7 @@ def _draw_annotation_overlay_on_page(
                         float(link_rect.y1),
                     ),
                     source_target_point=prepared.source_target_point,
+                    palette=prepared.palette,
                 )
             )
             continue
@@ -3077,7 +3256,7 @@ def _draw_annotation_overlay_on_page(
                 AnnotationContinuationItem(
                     marker=prepared.marker,
                     item=prepared.item,
-                    remaining_lines=[list(line) for line in prepared.styled_lines],
+                    remaining_lines=[],
                     source_marker_rect=(
                         float(prepared.marker_rect.x0),
                         float(prepared.marker_rect.y0),
@@ -3085,16 +3264,15 @@ def _draw_annotation_overlay_on_page(
                         float(prepared.marker_rect.y1),
                     ),
                     source_target_point=prepared.source_target_point,
+                    palette=prepared.palette,
                 )
             )
             continue
 
-        visible_lines = [list(line) for line in prepared.styled_lines[:full_lines_to_draw]]
-        remaining_lines = [list(line) for line in prepared.styled_lines[full_lines_to_draw:]]
+        visible_lines = prepared.styled_lines[:full_lines_to_draw]
         box_height = _estimate_callout_box_height(len(visible_lines))
         box_bottom = full_box_top + box_height
-        right_occupied.append((full_box_top, box_bottom))
-        right_occupied.sort(key=lambda pair: pair[0])
+        right_occupied.insert(full_box_top, box_bottom)
 
         box_rect = fitz.Rect(
             right_lane_left,
@@ -3103,20 +3281,23 @@ def _draw_annotation_overlay_on_page(
             box_bottom,
         )
 
-        page.draw_line(
+        shape.draw_line(
             (prepared.anchor_x + 1.0, prepared.anchor_y),
             (
                 box_rect.x0 - 2.0,
                 _clamp(prepared.anchor_y, box_rect.y0 + 6.0, box_rect.y1 - 6.0),
             ),
+        )
+        shape.finish(
             color=prepared.palette.callout_border,
             width=0.8,
+            closePath=False,
             stroke_opacity=0.9,
-            overlay=True,
         )
 
         _draw_callout(
-            page,
+            shape,
+            writer,
             box_rect=box_rect,
             header_text=_build_callout_header(prepared.item, marker=prepared.marker),
             lines=[''.join(run.text for run in line).strip() for line in visible_lines],
@@ -3126,12 +3307,12 @@ def _draw_annotation_overlay_on_page(
             mono_font_name=overlay_mono_font_name,
         )
 
-        if remaining_lines:
+        if full_lines_to_draw < len(prepared.styled_lines):
             continuation_items.append(
                 AnnotationContinuationItem(
                     marker=prepared.marker,
                     item=prepared.item,
-                    remaining_lines=remaining_lines,
+                    remaining_lines=[],
                     source_marker_rect=(
                         float(box_rect.x0),
                         float(box_rect.y0),
@@ -3139,9 +3320,12 @@ def _draw_annotation_overlay_on_page(
                         float(box_rect.y1),
                     ),
                     source_target_point=prepared.source_target_point,
+                    palette=prepared.palette,
                 )
             )
 
+    shape.commit(overlay=True)
+    writer.write_text(page, color=(0.08, 0.08, 0.08), overlay=True)
     return continuation_items
 
 
@@ -3156,6 +3340,23 @@ def _max_continuation_lines_for_height(height: float) -> int:
     return max(0, int(available // CALLOUT_LINE_HEIGHT))
 
 
+def _insert_continuation_plain_lines(
+    shape,
+    lines: list[str],
+    *,
+    origin: tuple[float, float],
+    font_name: str,
+) -> None:
+    shape.insert_text(
+        origin,
+        lines,
+        fontsize=8.0,
+        lineheight=CALLOUT_LINE_HEIGHT / 8.0,
+        color=(0.07, 0.07, 0.07),
+        fontname=font_name,
+    )
+
+
 def _insert_internal_link(
     page,
     *,
@@ -3163,12 +3364,10 @@ def _insert_internal_link(
     target_page_index: int | None,
     target_point: tuple[float, float],
 ) -> None:
-    if target_page_index is None:
+    if target_page_index is None or fitz is None:
         return
 
     try:
-        import pymupdf as fitz
-
         page.insert_link(
             {
                 'kind': fitz.LINK_GOTO,
@@ -3195,8 +3394,6 @@ def _append_annotation_continuation_pages(
     if not continuation_items:
         return insert_after_page_index
 
-    import pymupdf as fitz
-
     page_width = float(source_page_size[0]) if source_page_size else float(PAGE_WIDTH)
     page_height = float(source_page_size[1]) if source_page_size else float(PAGE_HEIGHT)
     if page_width <= 0 or page_height <= 0:
@@ -3211,6 +3408,8 @@ def _append_annotation_continuation_pages(
     overlay_mono_font_token, overlay_mono_font_path = _resolve_overlay_mono_font_resource()
     overlay_mono_font_name = overlay_mono_font_token
 
+    # Continuation sheets are wider than the callout lane, so the full text is
+    # re-wrapped here; items arrive with empty remaining_lines.
     pending_items: list[AnnotationContinuationItem] = []
     for continuation_item in continuation_items:
         continuation_item.remaining_lines = _wrap_overlay_markdown_lines(
@@ -3226,6 +3425,19 @@ def _append_annotation_continuation_pages(
         if continuation_item.remaining_lines:
             pending_items.append(continuation_item)
     continuation_page_no = 0
+    header_prefixes: dict[str, str] = {}
+    # Block geometry only varies vertically; fix the horizontal extents once.
+    block_x0 = margin_x
+    block_x1 = margin_x + content_width
+    header_x0 = block_x0 + 6.0
+    header_x1 = block_x1 - 6.0
+    body_x0 = block_x0 + 8.0
+    # New pages share the source page size, so the banner never moves either.
+    banner_height = _clamp(page_height * 0.06, 34.0, 46.0)
+    banner_rect = fitz.Rect(margin_x, top_margin, page_width - margin_x, top_margin + banner_height)
+    banner_title_point = (banner_rect.x0 + 8.0, banner_rect.y0 + 14.0)
+    banner_subtitle_rect = banner_rect + (8.0, 18.0, -8.0, -2.0)
+    first_block_top = banner_rect.y1 + 10.0
 
     while pending_items:
         continuation_page_no += 1
@@ -3235,7 +3447,6 @@ def _append_annotation_continuation_pages(
             height=page_height,
         )
         insert_after_page_index += 1
-        page_rect = page.rect
         overlay_font_name = _ensure_overlay_font(
             page,
             font_name=font_name,
@@ -3246,48 +3457,46 @@ def _append_annotation_continuation_pages(
             font_name=overlay_mono_font_token,
             font_path=overlay_mono_font_path,
         )
+        font_table = _overlay_font_table(overlay_font_name, overlay_mono_font_name)
+        # Everything on the sheet goes onto one Shape committed once per page;
+        # its text is emitted after all fills, so blocks never cover body text.
+        shape = page.new_shape()
 
-        banner_height = _clamp(page_height * 0.06, 34.0, 46.0)
-        banner_rect = fitz.Rect(
-            margin_x,
-            top_margin,
-            page_rect.x1 - margin_x,
-            top_margin + banner_height,
-        )
-        page.draw_rect(
-            banner_rect,
+        shape.draw_rect(banner_rect)
+        shape.finish(
             color=(0.64, 0.66, 0.69),
             fill=(0.92, 0.92, 0.91),
             width=0.9,
             fill_opacity=0.94,
             stroke_opacity=0.95,
-            overlay=True,
         )
 
         title = f'Annotation Continuation · Source Page {source_page_number}'
         if continuation_page_no > 1:
             title = f'{title} (cont. {continuation_page_no})'
-        page.insert_text(
-            fitz.Point(banner_rect.x0 + 8.0, banner_rect.y0 + 14.0),
+        shape.insert_text(
+            banner_title_point,
             title,
             fontsize=11.0,
             color=(0.20, 0.22, 0.24),
             fontname=overlay_font_name,
-            overlay=True,
         )
-        page.insert_textbox(
-            banner_rect + (8.0, 18.0, -8.0, -2.0),
+        shape.insert_textbox(
+            banner_subtitle_rect,
             'Continuation sheet linked to source highlights. Click marker headers to jump back to the paper region.',
             fontsize=8.0,
             color=(0.42, 0.44, 0.46),
             fontname=overlay_font_name,
             align=0,
-            overlay=True,
         )
 
-        cursor_y = banner_rect.y1 + 10.0
+        cursor_y = first_block_top
         rendered_any = False
         next_pending_items: list[AnnotationContinuationItem] = []
+        # Blocks are stacked without overlap, so their rects can be filled per
+        # palette instead of in layout order.
+        rects_by_palette: dict[OverlayPalette, tuple[list[fitz.Rect], list[fitz.Rect]]] = {}
+        strike_segments: list[tuple[float, float, float]] = []
 
         for continuation_item in pending_items:
             if not continuation_item.remaining_lines:
@@ -3307,92 +3516,90 @@ def _append_annotation_continuation_pages(
             rendered_any = True
 
             block_height = _estimate_continuation_block_height(len(line_runs))
-            block_rect = fitz.Rect(
-                margin_x,
-                cursor_y,
-                margin_x + content_width,
-                cursor_y + block_height,
-            )
-            label_rect = fitz.Rect(
-                block_rect.x0,
-                block_rect.y0,
-                block_rect.x1,
-                block_rect.y0 + 18.0,
-            )
-
-            palette = _overlay_palette(continuation_item.item)
-            page.draw_rect(
-                block_rect,
-                color=palette.callout_border,
-                fill=palette.callout_fill,
-                width=0.85,
-                fill_opacity=0.9,
-                stroke_opacity=0.95,
-                overlay=True,
-            )
-            page.draw_rect(
-                label_rect,
-                color=palette.callout_border,
-                fill=palette.label_fill,
-                width=0,
-                fill_opacity=0.95,
-                stroke_opacity=0.95,
-                overlay=True,
-            )
-
-            part_label = f'Part {continuation_item.next_part_index}'
+            block_rect = fitz.Rect(block_x0, cursor_y, block_x1, cursor_y + block_height)
+            label_rect = fitz.Rect(block_x0, cursor_y, block_x1, cursor_y + 18.0)
+
+            palette = continuation_item.palette or _overlay_palette(continuation_item.item)
+            block_rects, label_rects = rects_by_palette.setdefault(palette, ([], []))
+            block_rects.append(block_rect)
+            label_rects.append(label_rect)
+
+            # Only the part suffix changes between parts of the same item.
+            header_prefix = header_prefixes.get(continuation_item.marker)
+            if header_prefix is None:
+                header_prefix = _build_callout_header(continuation_item.item, marker=continuation_item.marker)
+                header_prefixes[continuation_item.marker] = header_prefix
+            header_text = f'{header_prefix} · Part {continuation_item.next_part_index}'
+            if continuation_item.remaining_lines:
+                header_text = f'{header_text} · CONT.'
             continuation_item.next_part_index += 1
-            header_text = _build_callout_header(
-                continuation_item.item,
-                marker=continuation_item.marker,
-                part_label=part_label,
-                continued=bool(continuation_item.remaining_lines),
-            )
-            page.insert_textbox(
-                label_rect + (6.0, 2.0, -6.0, -1.0),
+            shape.insert_textbox(
+                (header_x0, cursor_y + 2.0, header_x1, cursor_y + 17.0),
                 header_text,
                 fontsize=8.2,
                 color=(0.08, 0.08, 0.08),
                 fontname=overlay_font_name,
                 align=0,
-                overlay=True,
             )
 
+            # Block height is derived from len(line_runs), so every line fits.
             body_y = label_rect.y1 + 8.0
-            max_body_y = block_rect.y1 - 5.0
+            # Consecutive plain base-font lines are written as one multi-line
+            # text object; styled lines fall back to one operator per run.
+            plain_lines: list[str] = []
+            plain_top = body_y
             for runs in line_runs:
-                if body_y > max_body_y:
-                    break
-                body_x = block_rect.x0 + 8.0
+                body_x = body_x0
                 if not runs:
+                    if plain_lines:
+                        plain_lines.append('')
                     body_y += CALLOUT_LINE_HEIGHT
                     continue
-                for run in runs:
-                    run_text = str(run.text or '')
-                    if not run_text:
-                        continue
-                    run_font = _overlay_run_font_name(
+                run_fonts = [
+                    _overlay_run_font_name(
                         run,
                         base_font=overlay_font_name,
                         mono_font=overlay_mono_font_name,
+                        font_table=font_table,
+                    )
+                    for run in runs
+                ]
+                if all(
+                    run_font == overlay_font_name and not run.strike
+                    for run, run_font in zip(runs, run_fonts)
+                ):
+                    if not plain_lines:
+                        plain_top = body_y
+                    plain_lines.append(''.join(str(run.text or '') for run in runs))
+                    body_y += CALLOUT_LINE_HEIGHT
+                    continue
+                if plain_lines:
+                    _insert_continuation_plain_lines(
+                        shape,
+                        plain_lines,
+                        origin=(body_x0, plain_top),
+                        font_name=overlay_font_name,
                     )
+                    plain_lines = []
+                for run, run_font in zip(runs, run_fonts):
+                    run_text = str(run.text or '')
+                    if not run_text:
+                        continue
                     try:
-                        page.insert_text(
-                            fitz.Point(body_x, body_y),
+                        shape.insert_text(
+                            (body_x, body_y),
                             run_text,
                             fontsize=8.0,
                             color=(0.07, 0.07, 0.07),
                             fontname=run_font,
-                            overlay=True,
                         )
                     except Exception:
-                        page.insert_text(
-                            fitz.Point(body_x, body_y),
+                        shape.insert_text(
+                            (body_x, body_y),
                             run_text,
                             fontsize=8.0,
                             color=(0.07, 0.07, 0.07),
                             fontname=overlay_font_name,
-                            overlay=True,
                         )
                         run_font = overlay_font_name
 
@@ -3402,17 +3609,16 @@ def _append_annotation_continuation_pages(
                         font_size=8.0,
                     )
                     if run.strike and run_text.strip():
-                        strike_y = body_y - (8.0 * 0.32)
-                        page.draw_line(
-                            (body_x, strike_y),
-                            (body_x + run_width, strike_y),
-                            color=(0.07, 0.07, 0.07),
-                            width=0.76,
-                            stroke_opacity=0.95,
-                            overlay=True,
-                        )
+                        strike_segments.append((body_x, body_x + run_width, body_y - (8.0 * 0.32)))
                     body_x += run_width
                 body_y += CALLOUT_LINE_HEIGHT
+            if plain_lines:
+                _insert_continuation_plain_lines(
+                    shape,
+                    plain_lines,
+                    origin=(body_x0, plain_top),
+                    font_name=overlay_font_name,
+                )
 
             _insert_internal_link(
                 page=page,
@@ -3450,6 +3656,36 @@ def _append_annotation_continuation_pages(
             if continuation_item.remaining_lines:
                 next_pending_items.append(continuation_item)
 
+        for palette, (block_rects, label_rects) in rects_by_palette.items():
+            for block_rect in block_rects:
+                shape.draw_rect(block_rect)
+            shape.finish(
+                color=palette.callout_border,
+                fill=palette.callout_fill,
+                width=0.85,
+                fill_opacity=0.9,
+                stroke_opacity=0.95,
+            )
+            for label_rect in label_rects:
+                shape.draw_rect(label_rect)
+            shape.finish(
+                color=palette.callout_border,
+                fill=palette.label_fill,
+                width=0,
+                fill_opacity=0.95,
+                stroke_opacity=0.95,
+            )
+        if strike_segments:
+            for x0, x1, strike_y in strike_segments:
+                shape.draw_line((x0, strike_y), (x1, strike_y))
+            shape.finish(
+                color=(0.07, 0.07, 0.07),
+                width=0.76,
+                closePath=False,
+                stroke_opacity=0.95,
+            )
+        shape.commit(overlay=True)
+
         if not rendered_any:
             logger.warning(
                 'Failed to layout annotation continuation content for source page %s; stopping append loop.',
@@ -3475,10 +3711,8 @@ def _render_annotated_source_pdf(
     if not source_pdf_bytes or not source_annotations:
         return None
 
-    try:
-        import pymupdf as fitz
-    except Exception as exc:
-        logger.warning('PyMuPDF unavailable for annotation overlay: %s', exc)
+    if fitz is None:
+        logger.warning('PyMuPDF unavailable for annotation overlay.')
         return None
 
     overlay_items = _normalize_overlay_items(source_annotations)
@@ -3491,55 +3725,117 @@ def _render_annotated_source_pdf(
         grouped[item.page_number].append(item)
 
     source_doc = None
+    overlay_doc = None
     output_doc = None
     try:
         source_doc = fitz.open(stream=source_pdf_bytes, filetype='pdf')
-        if source_doc.is_encrypted:
-            authenticated = False
-            try:
-                authenticated = bool(source_doc.authenticate(''))
-            except Exception:
-                authenticated = False
-            if not authenticated:
-                logger.warning('Source PDF encrypted; skip annotation overlay rendering.')
-                return None
-
-        output_doc = fitz.open()
+        # authenticate() reports failure through its return value; anything
+        # it raises is handled by the surrounding try.
+        if source_doc.is_encrypted and not source_doc.authenticate(''):
+            logger.warning('Source PDF encrypted; skip annotation overlay rendering.')
+            return None
 
+        # Overlays and continuation sheets are drawn into their own document, page-aligned
+        # with the output (annotation-free pages get blank placeholders), so continuation
+        # links address final output page indices and the overlay fonts are embedded once.
+        # Only this document is font-subsetted; the source pages keep their own fonts as-is.
+        overlay_doc = fitz.open()
+        # Source page index -> (overlay page index, index of its last continuation sheet).
+        overlay_spans: dict[int, tuple[int, int]] = {}
         total_pages = source_doc.page_count
         for source_page_index in range(total_pages):
             source_page_number = source_page_index + 1
-            output_doc.insert_pdf(
-                source_doc,
-                from_page=source_page_index,
-                to_page=source_page_index,
-            )
-            output_page_index = output_doc.page_count - 1
-            output_page = output_doc.load_page(output_page_index)
-            page_items = grouped.get(source_page_number, [])
+            page_items = grouped.get(source_page_number)
+            if not page_items:
+                overlay_doc.new_page()
+                continue
+
+            source_rect = source_doc.load_page(source_page_index).rect
+            overlay_page = overlay_doc.new_page(width=source_rect.width, height=source_rect.height)
+            overlay_page_index = overlay_page.number
             continuation_items = _draw_annotation_overlay_on_page(
-                output_page,
+                overlay_page,
                 page_items,
                 font_name=overlay_font_name,
                 font_path=overlay_font_path,
             )
-            _draw_page_identity_tag(
-                output_page,
-                source_page_number=source_page_number,
-            )
-            source_page_size = (float(output_page.rect.width), float(output_page.rect.height))
             for continuation_item in continuation_items:
-                continuation_item.source_output_page_index = output_page_index
-            output_page_index = _append_annotation_continuation_pages(
-                output_doc,
+                continuation_item.source_output_page_index = overlay_page_index
+            last_page_index = _append_annotation_continuation_pages(
+                overlay_doc,
                 source_page_number=source_page_number,
                 continuation_items=continuation_items,
-                insert_after_page_index=output_page_index,
-                source_page_size=source_page_size,
+                insert_after_page_index=overlay_page_index,
+                source_page_size=(float(source_rect.width), float(source_rect.height)),
                 font_name=overlay_font_name,
                 font_path=overlay_font_path,
             )
+            overlay_spans[source_page_index] = (overlay_page_index, last_page_index)
 
+        # The overlay fonts are embedded whole (the CJK face is ~15 MB);
+        # subsetting first keeps the deflate pass and the merged PDF small.
+        try:
+            overlay_doc.subset_fonts()
+        except Exception as exc:
+            logger.debug('Failed to subset annotation overlay fonts: %s', exc)
+
+        output_doc = fitz.open()
+        # final=False keeps each source's graft map alive across the insert_pdf and
+        # show_pdf_page calls below, so shared fonts and images are copied only once.
+        source_page_index = 0
+        while source_page_index < total_pages:
+            source_page_number = source_page_index + 1
+            span = overlay_spans.get(source_page_index)
+            if span is None:
+                # Copy a run of annotation-free pages in one call; they only
+                # need the identity tag.
+                run_end_index = source_page_index
+                while run_end_index + 1 < total_pages and (run_end_index + 1) not in overlay_spans:
+                    run_end_index += 1
+                first_output_index = output_doc.page_count
+                output_doc.insert_pdf(
+                    source_doc,
+                    from_page=source_page_index,
+                    to_page=run_end_index,
+                    final=False,
+                )
+                for offset in range(run_end_index - source_page_index + 1):
+                    _draw_page_identity_tag(
+                        output_doc.load_page(first_output_index + offset),
+                        source_page_number=source_page_number + offset,
+                    )
+                source_page_index = run_end_index + 1
+                continue
+
+            overlay_page_index, last_page_index = span
+            output_doc.insert_pdf(
+                source_doc,
+                from_page=source_page_index,
+                to_page=source_page_index,
+                final=False,
+            )
+            output_page = output_doc.load_page(overlay_page_index)
+            output_page.show_pdf_page(output_page.rect, overlay_doc, overlay_page_index)
+            _draw_page_identity_tag(
+                output_page,
+                source_page_number=source_page_number,
+            )
+            if last_page_index > overlay_page_index:
+                output_doc.insert_pdf(
+                    overlay_doc,
+                    from_page=overlay_page_index + 1,
+                    to_page=last_page_index,
+                    links=False,
+                    final=False,
+                )
+            source_page_index += 1
+
+        # Links are copied once every target page exists in the output.
+        for overlay_page_index, last_page_index in overlay_spans.values():
+            for page_index in range(overlay_page_index, last_page_index + 1):
+                output_page = output_doc.load_page(page_index)
+                for link in overlay_doc.load_page(page_index).get_links():
+                    output_page.insert_link(link)
         return output_doc.tobytes(garbage=3, deflate=True)
     except Exception as exc:
         logger.warning('Failed to render annotated source PDF: %s', exc)
@@ -3547,33 +3843,45 @@ def _render_annotated_source_pdf(
     finally:
         if output_doc is not None:
             output_doc.close()
+        if overlay_doc is not None:
+            overlay_doc.close()
         if source_doc is not None:
             source_doc.close()
 
 
-def _merge_report_with_source_pdf_pages(report_pdf_bytes: bytes, source_pdf_bytes: bytes | None) -> bytes:
-    if not source_pdf_bytes:
-        return report_pdf_bytes
-
-    merged = _merge_with_pypdf(report_pdf_bytes, source_pdf_bytes)
-    if merged:
-        return merged
-
-    merged = _merge_with_pymupdf(report_pdf_bytes, source_pdf_bytes)
-    if merged:
-        return merged
-
-    return report_pdf_bytes
-
-
-def _merge_report_with_annotated_source_pdf_pages(
+def _write_report_with_source_pdf_pages(
+    output: BinaryIO,
+    report_pdf_bytes: bytes,
+    source_pdf_bytes: bytes | None,
+) -> None:
+    if source_pdf_bytes:
+        # Merges write into a seekable target so a failed attempt can be rolled back (and the
+        # PDF writers themselves tell() for xref offsets). Pipes, sockets and other non-seekable
+        # outputs get the merged PDF buffered in memory and written in one call.
+        target = output if output.seekable() else io.BytesIO()
+        start = target.tell()
+        for merge in (_merge_with_pypdf, _merge_with_pymupdf):
+            if merge(report_pdf_bytes, source_pdf_bytes, target):
+                if target is not output:
+                    output.write(target.getbuffer())
+                return
+            # Drop whatever a failed merge managed to write before falling back.
+            target.seek(start)
+            target.truncate()
+
+    output.write(report_pdf_bytes)
+
+
+def _write_report_with_annotated_source_pdf_pages(
+    output: BinaryIO,
     report_pdf_bytes: bytes,
     *,
     source_pdf_bytes: bytes | None,
     source_annotations: list[dict[str, Any]] | None,
-) -> bytes:
+) -> None:
     if not source_pdf_bytes:
-        return report_pdf_bytes
+        output.write(report_pdf_bytes)
+        return
 
     annotated_source_pdf_bytes: bytes | None = None
     if source_annotations:
@@ -3582,7 +3890,8 @@ def _merge_report_with_annotated_source_pdf_pages(
             source_annotations,
         )
 
-    return _merge_report_with_source_pdf_pages(
+    _write_report_with_source_pdf_pages(
+        output,
         report_pdf_bytes,
         annotated_source_pdf_bytes or source_pdf_bytes,
     )
@@ -3663,10 +3972,14 @@ def build_review_report_pdf(
     owner_email: str | None = None,
     token_usage: dict[str, Any] | None = None,
     agent_model: str | None = None,
-) -> bytes:
+    output: BinaryIO | None = None,
+    minimal_cover: bool = False,
+) -> bytes | None:
     fonts = _resolve_report_fonts()
     logo_path = _resolve_logo_path()
-    styles = _build_styles(fonts)
+    styles = _report_styles(fonts)
+    body_style = styles['BodyTextEnterprise']
+    muted_style = styles['SmallMutedText']
     meta_review = meta_review if isinstance(meta_review, dict) else {}
 
     token_payload = token_usage if isinstance(token_usage, dict) else {}
@@ -3686,7 +3999,12 @@ def build_review_report_pdf(
         report_code = f"DS-RV-{fallback_token[:9].ljust(9, 'X')}"
     model_display = str(agent_model or '').strip() or '-'
 
-    buffer = io.BytesIO()
+    # `output` only saves handing the finished PDF back as bytes: ReportLab still assembles the
+    # whole document in memory before writing it out, and the source-PDF merges load both
+    # documents, so peak memory is the same as without a stream. Without a source appendix the
+    # rendered report goes to the caller's stream without an intermediate BytesIO copy.
+    stream_directly = output is not None and not source_pdf_bytes
+    buffer = output if stream_directly else io.BytesIO()
     document = SimpleDocTemplate(
         buffer,
         pagesize=A4,
@@ -3710,70 +4028,68 @@ def build_review_report_pdf(
         except Exception as exc:
             logger.warning('Failed to render cover logo for review PDF: %s', exc)
 
-    story.append(Paragraph('DeepScientist', styles['CoverBrand']))
-    story.append(Paragraph('AI REVIEW REPORT', styles['CoverTitle']))
+    story.append(_static_paragraph('DeepScientist', styles['CoverBrand']))
+    story.append(_static_paragraph('AI REVIEW REPORT', styles['CoverTitle']))
     story.append(Paragraph(_escape(workspace_title or 'Review Workspace'), styles['CoverWorkspaceTitle']))
     story.append(Paragraph(f'Source file: {_escape(source_pdf_name or "-")}', styles['CoverMeta']))
     story.append(Spacer(1, 9 * mm))
 
-    cover_table_data = [
-        [
-            Paragraph('<b>Document No.</b>', styles['BodyTextEnterprise']),
-            Paragraph(_escape(document_no_display), styles['BodyTextEnterprise']),
-            Paragraph('<b>Work ID</b>', styles['BodyTextEnterprise']),
-            Paragraph(_escape(report_code), styles['BodyTextEnterprise']),
-        ],
-        [
-            Paragraph('<b>Status</b>', styles['BodyTextEnterprise']),
-            Paragraph(_escape((status or 'unknown').title()), styles['BodyTextEnterprise']),
-            Paragraph('<b>Agent Model</b>', styles['BodyTextEnterprise']),
-            Paragraph(_escape(model_display), styles['BodyTextEnterprise']),
-        ],
-        [
-            Paragraph('<b>Token Usage</b>', styles['BodyTextEnterprise']),
+    if minimal_cover:
+        story.append(
             Paragraph(
-                _escape(f'Input {token_input} | Output {token_output} | Total {token_total}'),
-                styles['BodyTextEnterprise'],
-            ),
-            Paragraph('<b>LLM Requests</b>', styles['BodyTextEnterprise']),
-            Paragraph(_escape(str(token_requests)), styles['BodyTextEnterprise']),
-        ],
-        [
-            Paragraph('<b>Generated At</b>', styles['BodyTextEnterprise']),
-            Paragraph(_escape(_format_datetime(exported_at)), styles['BodyTextEnterprise']),
-            Paragraph('<b>Producer</b>', styles['BodyTextEnterprise']),
-            Paragraph('DeepReviewer 2.0', styles['BodyTextEnterprise']),
-        ],
-    ]
-
-    cover_table = Table(
-        cover_table_data,
-        colWidths=[30 * mm, 56 * mm, 30 * mm, 54 * mm],
-        hAlign='CENTER',
-    )
-    cover_table.setStyle(
-        TableStyle(
+                _escape(
+                    f'Document No. {document_no_display} · Work ID {report_code} · '
+                    f"Status {(status or 'unknown').title()}"
+                ),
+                body_style,
+            )
+        )
+    else:
+        cover_table_data = [
             [
-                ('BOX', (0, 0), (-1, -1), 0.8, colors.HexColor('#CBD5E1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E2E8F0')),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F8FAFC')),
-                ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#FCFCFD')),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 4.5),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4.5),
-            ]
+                _static_paragraph('<b>Document No.</b>', body_style),
+                Paragraph(_escape(document_no_display), body_style),
+                _static_paragraph('<b>Work ID</b>', body_style),
+                report_code,
+            ],
+            [
+                _static_paragraph('<b>Status</b>', body_style),
+                (status or 'unknown').title(),
+                _static_paragraph('<b>Agent Model</b>', body_style),
+                Paragraph(_escape(model_display), body_style),
+            ],
+            [
+                _static_paragraph('<b>Token Usage</b>', body_style),
+                Paragraph(
+                    _escape(f'Input {token_input} | Output {token_output} | Total {token_total}'),
+                    body_style,
+                ),
+                _static_paragraph('<b>LLM Requests</b>', body_style),
+                str(token_requests),
+            ],
+            [
+                _static_paragraph('<b>Generated At</b>', body_style),
+                _format_datetime(exported_at),
+                _static_paragraph('<b>Producer</b>', body_style),
+                _static_paragraph('DeepReviewer 2.0', body_style),
+            ],
+        ]
+
+        cover_table = Table(
+            cover_table_data,
+            colWidths=[30 * mm, 56 * mm, 30 * mm, 54 * mm],
+            hAlign='CENTER',
         )
-    )
-    story.append(cover_table)
+        cover_table.setStyle(_COVER_TABLE_STYLE)
+        cover_table.setStyle([('FONTNAME', (0, 0), (-1, -1), fonts.body)])
+        story.append(cover_table)
     story.append(Spacer(1, 10 * mm))
 
     story.append(
         Paragraph(
             'This document is generated for professional review, archival, and collaborative decision making. '
             'All conclusions should be interpreted with domain expertise and final human verification.',
-            styles['SmallMutedText'],
+            muted_style,
         )
     )
     story.append(PageBreak())
@@ -3799,13 +4115,13 @@ def build_review_report_pdf(
         story.append(
             Paragraph(
                 'The appendix below attaches source paper pages and overlays review highlights for ISSUE / SUGGESTION / EVIDENCE objects.',
-                styles['BodyTextEnterprise'],
+                body_style,
             )
         )
         story.append(
             Paragraph(
                 'Callout boxes are placed near page margins to avoid covering core content and remain within page boundaries.',
-                styles['SmallMutedText'],
+                muted_style,
             )
         )
 
@@ -3813,7 +4129,7 @@ def build_review_report_pdf(
     story.append(
         Paragraph(
             'End of report · DeepScientist Review Export',
-            styles['SmallMutedText'],
+            muted_style,
         )
     )
 
@@ -3828,9 +4144,17 @@ def build_review_report_pdf(
         )
 
     document.build(story, onFirstPage=_on_page, onLaterPages=_on_page)
+    if stream_directly:
+        return None
+
     report_pdf_bytes = buffer.getvalue()
-    return _merge_report_with_annotated_source_pdf_pages(
+    target = output if output is not None else io.BytesIO()
+    _write_report_with_annotated_source_pdf_pages(
+        target,
         report_pdf_bytes,
         source_pdf_bytes=source_pdf_bytes,
         source_annotations=source_annotations,
     )
+    if output is not None:
+        return None
+    return target.getvalue()
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Any
 
 from deepreview.types import AnnotationItem
 
+_OBJECT_TYPE_MAP: dict[str, str] = {
+    'issue': 'issue',
+    'suggestion': 'suggestion',
+    'verification': 'verification',
+    'evidence': 'suggestion',
+}
 
-@dataclass
+_FALLBACK_RECT_TEMPLATE: dict[str, float] = {
+    'x1': 8.0,
+    'y1': 0.0,
+    'x2': 92.0,
+    'y2': 0.0,
+    'width': 100.0,
+    'height': 100.0,
+}
+
+
+@dataclass(slots=True)
 class _ContentLine:
     page_number: int
     text: str
@@ -14,12 +31,7 @@ class _ContentLine:
 
 
 def _normalize_object_type(value: Any) -> str:
-    token = str(value or '').strip().lower()
-    if token in {'issue', 'suggestion', 'verification'}:
-        return token
-    if token == 'evidence':
-        return 'suggestion'
-    return 'suggestion'
+    return _OBJECT_TYPE_MAP.get(str(value or '').strip().lower(), 'suggestion')
 
 
 def _coerce_bbox(value: Any) -> tuple[float, float, float, float] | None:
@@ -51,31 +63,33 @@ def _coerce_bbox(value: Any) -> tuple[float, float, float, float] | None:
     return (x1, y1, x2, y2)
 
 
+def _content_row_page_number(row: dict[str, Any]) -> int | None:
+    page_idx = row.get('page_idx')
+    if isinstance(page_idx, int):
+        return page_idx + 1
+    for key in ('page_number', 'pageNumber', 'page'):
+        raw = row.get(key)
+        if raw is None:
+            continue
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
 def _collect_content_lines(
     content_list: list[dict[str, Any]] | None,
 ) -> tuple[dict[int, list[_ContentLine]], dict[int, tuple[float, float]]]:
     per_page: dict[int, list[_ContentLine]] = {}
-    page_refs: dict[int, tuple[float, float]] = {}
-    max_xy: dict[int, tuple[float, float]] = {}
+    # Running [max_x2, max_y2] per page, seeded with the 100-unit floor.
+    max_xy: dict[int, list[float]] = {}
 
     for row in content_list or []:
         if not isinstance(row, dict):
             continue
 
-        page_number: int | None = None
-        page_idx = row.get('page_idx')
-        if isinstance(page_idx, int):
-            page_number = page_idx + 1
-        else:
-            for key in ('page_number', 'pageNumber', 'page'):
-                raw = row.get(key)
-                try:
-                    if raw is not None:
-                        page_number = int(raw)
-                        break
-                except (TypeError, ValueError):
-                    continue
-
+        page_number = _content_row_page_number(row)
         if page_number is None or page_number < 1:
             continue
 
@@ -83,48 +97,84 @@ def _collect_content_lines(
         if not text:
             continue
 
-        bbox = _coerce_bbox(row.get('bbox'))
-        per_page.setdefault(page_number, []).append(_ContentLine(page_number=page_number, text=text, bbox=bbox))
+        raw_bbox = row.get('bbox')
+        bbox = _coerce_bbox(raw_bbox) if raw_bbox is not None else None
+        page_lines = per_page.get(page_number)
+        if page_lines is None:
+            page_lines = per_page[page_number] = []
+        page_lines.append(_ContentLine(page_number, text, bbox))
 
         if bbox is not None:
-            prev_x, prev_y = max_xy.get(page_number, (100.0, 100.0))
-            max_xy[page_number] = (max(prev_x, bbox[2]), max(prev_y, bbox[3]))
-
-    for page_number, (mx, my) in max_xy.items():
-        page_refs[page_number] = (max(100.0, float(mx)), max(100.0, float(my)))
+            extent = max_xy.get(page_number)
+            if extent is None:
+                extent = max_xy[page_number] = [100.0, 100.0]
+            extent[0] = max(extent[0], bbox[2])
+            extent[1] = max(extent[1], bbox[3])
 
+    page_refs = {page_number: (mx, my) for page_number, (mx, my) in max_xy.items()}
     return per_page, page_refs
 
 
-def _to_rect_dict(
-    bbox: tuple[float, float, float, float],
+def _index_page_bboxes(
+    content_lines_by_page: dict[int, list[_ContentLine]],
+) -> dict[int, tuple[list[int], list[tuple[float, float, float, float]]]]:
+    # Per page: line positions that carry a bbox, and those bboxes in the same order.
+    indexed: dict[int, tuple[list[int], list[tuple[float, float, float, float]]]] = {}
+    for page_number, lines in content_lines_by_page.items():
+        positions: list[int] = []
+        bboxes: list[tuple[float, float, float, float]] = []
+        for position, line in enumerate(lines):
+            if line.bbox is not None:
+                positions.append(position)
+                bboxes.append(line.bbox)
+        indexed[page_number] = (positions, bboxes)
+    return indexed
+
+
+def _bboxes_in_range(
+    page_bboxes: tuple[list[int], list[tuple[float, float, float, float]]],
+    start_idx: int,
+    end_idx: int,
+) -> list[tuple[float, float, float, float]]:
+    positions, bboxes = page_bboxes
+    return bboxes[bisect_left(positions, start_idx):bisect_left(positions, end_idx)]
+
+
+def _line_rects(
+    bboxes: list[tuple[float, float, float, float]],
     *,
     width_ref: float,
     height_ref: float,
-) -> dict[str, float]:
-    x1, y1, x2, y2 = bbox
-    return {
-        'x1': float(x1),
-        'y1': float(y1),
-        'x2': float(x2),
-        'y2': float(y2),
-        'width': float(max(1.0, width_ref)),
-        'height': float(max(1.0, height_ref)),
-    }
+) -> list[dict[str, float]]:
+    # Content-line bboxes are already float tuples from _coerce_bbox.
+    width = float(max(1.0, width_ref))
+    height = float(max(1.0, height_ref))
+    return [
+        {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2, 'width': width, 'height': height}
+        for x1, y1, x2, y2 in bboxes
+    ]
 
 
 def _union_rects(rects: list[dict[str, float]]) -> dict[str, float] | None:
     if not rects:
         return None
-    width_ref = float(rects[0].get('width') or 100.0)
-    height_ref = float(rects[0].get('height') or 100.0)
+    first = rects[0]
+    x1 = float(first['x1'])
+    y1 = float(first['y1'])
+    x2 = float(first['x2'])
+    y2 = float(first['y2'])
+    for item in rects[1:]:
+        x1 = min(x1, float(item['x1']))
+        y1 = min(y1, float(item['y1']))
+        x2 = max(x2, float(item['x2']))
+        y2 = max(y2, float(item['y2']))
     return {
-        'x1': min(float(item['x1']) for item in rects),
-        'y1': min(float(item['y1']) for item in rects),
-        'x2': max(float(item['x2']) for item in rects),
-        'y2': max(float(item['y2']) for item in rects),
-        'width': width_ref,
-        'height': height_ref,
+        'x1': x1,
+        'y1': y1,
+        'x2': x2,
+        'y2': y2,
+        'width': float(first.get('width') or 100.0),
+        'height': float(first.get('height') or 100.0),
     }
 
 
@@ -134,21 +184,15 @@ def _fallback_line_ratio_rect(
     end_line: int,
     total_lines: int,
 ) -> dict[str, float]:
-    total = max(1, int(total_lines))
-    start_idx = max(0, int(start_line) - 1)
-    end_idx = max(start_idx + 1, int(end_line))
-    y1 = (start_idx / total) * 100.0
-    y2 = (end_idx / total) * 100.0
-    y1 = max(0.0, min(98.0, y1))
-    y2 = max(y1 + 1.2, min(100.0, y2))
-    return {
-        'x1': 8.0,
-        'y1': y1,
-        'x2': 92.0,
-        'y2': y2,
-        'width': 100.0,
-        'height': 100.0,
-    }
+    total = max(1, total_lines)
+    start_idx = start_line - 1 if start_line > 1 else 0
+    end_idx = end_line if end_line > start_idx else start_idx + 1
+    y1 = max(0.0, min(98.0, (start_idx / total) * 100.0))
+    y2 = max(y1 + 1.2, min(100.0, (end_idx / total) * 100.0))
+    rect = _FALLBACK_RECT_TEMPLATE.copy()
+    rect['y1'] = y1
+    rect['y2'] = y2
+    return rect
 
 
 def _coerce_annotation_item(value: AnnotationItem | dict[str, Any]) -> AnnotationItem | None:
@@ -156,6 +200,7 @@ def _coerce_annotation_item(value: AnnotationItem | dict[str, Any]) -> Annotatio
         return value
     if not isinstance(value, dict):
         return None
+    # model_validate runs in pydantic-core; model_construct is slower for these rows.
     try:
         return AnnotationItem.model_validate(value)
     except Exception:
@@ -168,49 +213,45 @@ def build_source_annotations_for_export(
     content_list: list[dict[str, Any]] | None,
 ) -> list[dict[str, Any]]:
     content_lines_by_page, page_refs = _collect_content_lines(content_list)
+    bboxes_by_page = _index_page_bboxes(content_lines_by_page)
+    no_bboxes: tuple[list[int], list[tuple[float, float, float, float]]] = ([], [])
     output: list[dict[str, Any]] = []
+    append_output = output.append
 
     for index, raw_item in enumerate(annotations, start=1):
         ann = _coerce_annotation_item(raw_item)
         if ann is None:
             continue
 
-        page_number = max(1, int(ann.page))
-        page_lines = content_lines_by_page.get(page_number, [])
-        start_line = max(1, int(ann.start_line))
-        end_line = max(start_line, int(ann.end_line))
+        page_number = max(1, ann.page)
+        line_count = len(content_lines_by_page.get(page_number, ()))
+        page_bboxes = bboxes_by_page.get(page_number, no_bboxes)
+        start_line = max(1, ann.start_line)
+        end_line = max(start_line, ann.end_line)
         start_idx = max(0, start_line - 1)
-        end_idx = min(len(page_lines), end_line)
-
-        selected = page_lines[start_idx:end_idx] if page_lines else []
-        selected_boxes = [line.bbox for line in selected if line.bbox is not None]
+        end_idx = min(line_count, end_line)
 
-        if not selected_boxes and page_lines:
+        width_ref, height_ref = page_refs.get(page_number, (100.0, 100.0))
+        rects = _line_rects(
+            _bboxes_in_range(page_bboxes, start_idx, end_idx),
+            width_ref=width_ref,
+            height_ref=height_ref,
+        )
+        if not rects and line_count:
             nearby_start = max(0, start_idx - 2)
-            nearby_end = min(len(page_lines), end_idx + 2)
-            selected_boxes = [
-                line.bbox
-                for line in page_lines[nearby_start:nearby_end]
-                if line.bbox is not None
-            ]
-
-        rects: list[dict[str, float]] = []
-        if selected_boxes:
-            width_ref, height_ref = page_refs.get(page_number, (100.0, 100.0))
-            rects = [
-                _to_rect_dict(
-                    bbox,
-                    width_ref=width_ref,
-                    height_ref=height_ref,
-                )
-                for bbox in selected_boxes
-            ]
-        else:
+            nearby_end = min(line_count, end_idx + 2)
+            rects = _line_rects(
+                _bboxes_in_range(page_bboxes, nearby_start, nearby_end),
+                width_ref=width_ref,
+                height_ref=height_ref,
+            )
+
+        if not rects:
             rects = [
                 _fallback_line_ratio_rect(
                     start_line=start_line,
                     end_line=end_line,
-                    total_lines=max(len(page_lines), end_line),
+                    total_lines=max(line_count, end_line),
                 )
             ]
 
@@ -218,23 +259,23 @@ def build_source_annotations_for_export(
         if not rects or bounding_rect is None:
             continue
 
-        comment = str(ann.comment or '').strip()
-        content_text = str(ann.text or '').strip()
+        comment = ann.comment.strip()
+        content_text = ann.text.strip()
         display_text = comment or content_text or '(no text provided)'
 
-        output.append(
+        append_output(
             {
-                'annotation_id': str(ann.id),
+                'annotation_id': ann.id,
                 'page_number': page_number,
                 'rects': rects,
                 'bounding_rect': bounding_rect,
                 'object_type': _normalize_object_type(ann.object_type),
-                'severity': str(ann.severity or '').strip().lower() or None,
+                'severity': (ann.severity or '').strip().lower() or None,
                 'review_item_id': f'R{index:03d}',
                 'display_text': display_text,
                 'comment': comment,
                 'content_text': content_text,
-                'summary': str(ann.summary or '').strip() or None,
+                'summary': (ann.summary or '').strip() or None,
                 'color': None,
                 'tags': ['review_annotation'],
             }
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+import logging
 import traceback
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,23 +23,41 @@ from deepreview.adapters.paper_search import (
     PaperSearchAdapter,
     PaperSearchConfig,
 )
-from deepreview.config import get_settings
+from deepreview.config import Settings, get_settings
 from deepreview.prompts.review_agent_prompt import build_review_agent_system_prompt
 from deepreview.report.review_report_pdf import build_review_report_pdf
 from deepreview.report.source_annotations import build_source_annotations_for_export
-from deepreview.state import ensure_artifact_paths, fail_job, load_job_state, mutate_job_state, set_status
-from deepreview.storage import append_event, read_json, write_json_atomic, write_text_atomic
+from deepreview.state import (
+    ensure_artifact_paths,
+    fail_job,
+    flush_job_states,
+    load_job_state,
+    mutate_job_state,
+    set_status,
+)
+from deepreview.storage import (
+    append_event,
+    close_events,
+    flush_durability,
+    read_json,
+    write_json_atomic,
+    write_text_atomic,
+)
 from deepreview.tools.review_tools import ReviewRuntimeContext, build_review_tools
 from deepreview.types import AnnotationItem, JobStatus
 
+logger = logging.getLogger(__name__)
 
-def _resolved_api_key() -> str:
-    settings = get_settings()
+
+def _resolved_api_key(settings: Settings | None = None) -> str:
+    if settings is None:
+        settings = get_settings()
     return str(settings.openai_api_key or 'EMPTY')
 
 
-def _build_mineru_adapter() -> MineruAdapter:
-    settings = get_settings()
+def _build_mineru_adapter(settings: Settings | None = None) -> MineruAdapter:
+    if settings is None:
+        settings = get_settings()
     return MineruAdapter(
         MineruConfig(
             base_url=settings.mineru_base_url,
@@ -51,8 +72,9 @@ def _build_mineru_adapter() -> MineruAdapter:
     )
 
 
-def _build_paper_adapter() -> PaperSearchAdapter:
-    settings = get_settings()
+def _build_paper_adapter(settings: Settings | None = None) -> PaperSearchAdapter:
+    if settings is None:
+        settings = get_settings()
     return PaperSearchAdapter(
         search_cfg=PaperSearchConfig(
             enabled=settings.paper_search_enabled,
@@ -78,35 +100,58 @@ def _build_paper_adapter() -> PaperSearchAdapter:
     )
 
 
-def _build_run_config() -> RunConfig:
-    settings = get_settings()
-    provider = OpenAIProvider(
-        api_key=_resolved_api_key(),
+def _build_openai_client(settings: Settings | None = None) -> AsyncOpenAI:
+    if settings is None:
+        settings = get_settings()
+    return AsyncOpenAI(
+        api_key=_resolved_api_key(settings),
         base_url=settings.openai_base_url,
+    )
+
+
+def _build_run_config(
+    settings: Settings | None = None,
+    *,
+    openai_client: AsyncOpenAI | None = None,
+) -> RunConfig:
+    if settings is None:
+        settings = get_settings()
+    if openai_client is None:
+        openai_client = _build_openai_client(settings)
+    provider = OpenAIProvider(
+        openai_client=openai_client,
         use_responses=settings.openai_use_responses_api,
     )
     return RunConfig(model_provider=provider)
 
 
-def _build_agent_model() -> OpenAIChatCompletionsModel | OpenAIResponsesModel:
-    settings = get_settings()
-    client = AsyncOpenAI(
-        api_key=_resolved_api_key(),
-        base_url=settings.openai_base_url,
-    )
+def _build_agent_model(
+    settings: Settings | None = None,
+    *,
+    openai_client: AsyncOpenAI | None = None,
+) -> OpenAIChatCompletionsModel | OpenAIResponsesModel:
+    if settings is None:
+        settings = get_settings()
+    if openai_client is None:
+        openai_client = _build_openai_client(settings)
     if settings.openai_use_responses_api:
         return OpenAIResponsesModel(
             model=settings.agent_model,
-            openai_client=client,
+            openai_client=openai_client,
         )
     return OpenAIChatCompletionsModel(
         model=settings.agent_model,
-        openai_client=client,
+        openai_client=openai_client,
     )
 
 
-def _build_agent_model_settings(*, tool_choice: str | None = None) -> ModelSettings:
-    settings = get_settings()
+def _build_agent_model_settings(
+    *,
+    tool_choice: str | None = None,
+    settings: Settings | None = None,
+) -> ModelSettings:
+    if settings is None:
+        settings = get_settings()
     model_name = str(settings.agent_model or '').strip().lower()
     use_xhigh_reasoning = model_name in {'gpt-5.4', 'gpt-5.3', 'gpt-5.2'}
 
@@ -118,29 +163,28 @@ def _build_agent_model_settings(*, tool_choice: str | None = None) -> ModelSetti
     )
 
 
-def _sync_token_usage(job_id: str, usage: Any) -> None:
-    requests = int(getattr(usage, 'requests', 0) or 0)
-    input_tokens = int(getattr(usage, 'input_tokens', 0) or 0)
-    output_tokens = int(getattr(usage, 'output_tokens', 0) or 0)
-    total_tokens = int(getattr(usage, 'total_tokens', 0) or 0)
+def _exception_label(exc: BaseException) -> str:
+    return f'{type(exc).__name__}: {exc}'
 
-    def apply(job):
-        job.usage.token.requests = requests
-        job.usage.token.input_tokens = input_tokens
-        job.usage.token.output_tokens = output_tokens
-        job.usage.token.total_tokens = total_tokens
 
-    mutate_job_state(job_id, apply)
+def _continuation_input(result: Any, content: str) -> list[Any]:
+    # to_input_list() already returns a fresh list; append instead of re-splatting it.
+    items = result.to_input_list()
+    items.append({'role': 'user', 'content': content})
+    return items
 
 
 def _coerce_dict_rows(value: Any) -> list[dict[str, Any]]:
     if not isinstance(value, list):
         return []
+    # Rows decoded from JSON are plain dicts, so the common case needs no filtered copy.
+    if all(type(row) is dict for row in value):
+        return value
     return [row for row in value if isinstance(row, dict)]
 
 
 def _load_content_list(path: Path | None) -> list[dict[str, Any]] | None:
-    if path is None or not path.exists():
+    if path is None:
         return None
     try:
         payload = read_json(path)
@@ -156,7 +200,7 @@ def _load_content_list(path: Path | None) -> list[dict[str, Any]] | None:
 
 
 def _load_annotations_payload(path: Path | None) -> list[dict[str, Any]]:
-    if path is None or not path.exists():
+    if path is None:
         return []
     try:
         payload = read_json(path)
@@ -191,9 +235,16 @@ def _render_report_pdf(
     content_list: list[dict[str, Any]] | None,
     token_usage: dict[str, int],
     agent_model: str,
+    final_markdown_text: str | None = None,
+    source_pdf_bytes: bytes | None = None,
 ) -> dict[str, int]:
-    final_report_markdown = final_md_path.read_text(encoding='utf-8')
-    source_pdf_bytes = source_pdf_path.read_bytes() if source_pdf_path.exists() else None
+    if final_markdown_text is None:
+        final_markdown_text = final_md_path.read_text(encoding='utf-8')
+    if source_pdf_bytes is None:
+        try:
+            source_pdf_bytes = source_pdf_path.read_bytes()
+        except FileNotFoundError:
+            source_pdf_bytes = None
     source_annotations = build_source_annotations_for_export(
         annotations=annotations,
         content_list=content_list,
@@ -211,7 +262,7 @@ def _render_report_pdf(
         meta_review={},
         reviewers=[],
         raw_output=None,
-        final_report_markdown=final_report_markdown,
+        final_report_markdown=final_markdown_text,
         source_pdf_bytes=source_pdf_bytes,
         source_annotations=source_annotations,
         review_display_id=None,
@@ -259,7 +310,8 @@ def _complete_with_existing_final_report(job_id: str, *, warning: str) -> bool:
 
     report_pdf_path = Path(state.artifacts.report_pdf_path or artifacts['report_pdf'])
     pdf_error: str | None = None
-    if not report_pdf_path.exists():
+    pdf_ready = report_pdf_path.exists()
+    if not pdf_ready:
         try:
             source_pdf_path = Path(state.artifacts.source_pdf_path or artifacts['source_pdf'])
             annotations_path = Path(state.artifacts.annotations_path or artifacts['annotations'])
@@ -278,15 +330,17 @@ def _complete_with_existing_final_report(job_id: str, *, warning: str) -> bool:
                 token_usage=_token_usage_payload_from_state(state),
                 agent_model=str(get_settings().agent_model or '').strip(),
             )
+            pdf_ready = True
         except Exception as exc:
-            pdf_error = f'{type(exc).__name__}: {exc}'
+            pdf_error = _exception_label(exc)
+            pdf_ready = report_pdf_path.exists()
 
     def apply_completed(state_obj):
         state_obj.status = JobStatus.completed
         state_obj.final_report_ready = True
-        state_obj.pdf_ready = report_pdf_path.exists()
+        state_obj.pdf_ready = pdf_ready
         state_obj.artifacts.final_markdown_path = str(final_md_path)
-        state_obj.artifacts.report_pdf_path = str(report_pdf_path) if report_pdf_path.exists() else None
+        state_obj.artifacts.report_pdf_path = str(report_pdf_path) if pdf_ready else None
         state_obj.error = pdf_error
         state_obj.message = (
             'Review pipeline completed via recovery after post-write exception.'
@@ -305,12 +359,64 @@ def _complete_with_existing_final_report(job_id: str, *, warning: str) -> bool:
         job_id,
         'completed_recovered',
         warning=warning,
-        pdf_ready=report_pdf_path.exists(),
+        pdf_ready=pdf_ready,
         pdf_error=pdf_error,
     )
     return True
 
 
+async def _await_run_or_final_write(
+    job_id: str,
+    runtime: ReviewRuntimeContext,
+    run_task: asyncio.Task,
+    *,
+    attempt: int,
+) -> Any | None:
+    # Returns the run's result, or None once the final report is persisted and the run was
+    # cancelled or its failure ignored. Not a TaskGroup: a failed run must surface its own
+    # exception (or be ignored once the report is persisted) rather than an ExceptionGroup.
+    final_write_task = asyncio.create_task(runtime.final_markdown_written.wait())
+    try:
+        await asyncio.wait({run_task, final_write_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        final_write_task.cancel()
+
+    if run_task.done():
+        try:
+            return run_task.result()
+        except Exception as exc:
+            if not runtime.final_markdown_text:
+                raise
+            append_event(
+                job_id,
+                'agent_run_post_final_exception_ignored',
+                attempt=attempt,
+                error=_exception_label(exc),
+                reason='final_report_already_persisted',
+            )
+    else:
+        run_task.cancel()
+        append_event(
+            job_id,
+            'agent_run_cancelled_after_final_write',
+            attempt=attempt,
+            reason='final_report_already_persisted',
+        )
+        try:
+            await run_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            append_event(
+                job_id,
+                'agent_run_cancel_post_final_exception_ignored',
+                attempt=attempt,
+                error=_exception_label(exc),
+                reason='final_report_already_persisted',
+            )
+    return None
+
+
 async def run_job_async(job_id: str) -> None:
     settings = get_settings()
     job = load_job_state(job_id)
@@ -334,48 +440,85 @@ async def run_job_async(job_id: str) -> None:
 
     artifacts = ensure_artifact_paths(job_id)
     source_pdf = Path(artifacts['source_pdf'])
-    if not source_pdf.exists():
-        raise RuntimeError(f'Source PDF missing: {source_pdf}')
-    file_size = int(source_pdf.stat().st_size)
+    try:
+        file_size = int(source_pdf.stat().st_size)
+    except FileNotFoundError:
+        raise RuntimeError(f'Source PDF missing: {source_pdf}') from None
     if file_size <= 0:
         raise RuntimeError('Source PDF is empty.')
     if file_size > int(settings.max_pdf_bytes):
         raise RuntimeError(
             f'Source PDF too large: {file_size} bytes, max allowed {int(settings.max_pdf_bytes)} bytes.'
         )
+    source_pdf_bytes = await asyncio.to_thread(source_pdf.read_bytes)
 
     set_status(job_id, JobStatus.pdf_uploading_to_mineru, 'Submitting PDF to MinerU and uploading file...')
     set_status(job_id, JobStatus.pdf_parsing, 'Polling MinerU parse result and assembling markdown...')
 
-    mineru = _build_mineru_adapter()
-    parse_result = await mineru.parse_pdf(pdf_path=source_pdf, data_id=job_id)
-
-    write_text_atomic(Path(artifacts['mineru_markdown']), parse_result.markdown)
-    if parse_result.content_list is not None:
-        write_json_atomic(Path(artifacts['mineru_content_list']), {'content_list': parse_result.content_list})
-    if parse_result.raw_result is not None:
-        write_json_atomic(Path(artifacts['raw_result']), parse_result.raw_result)
+    mineru = _build_mineru_adapter(settings)
+    paper_adapter = _build_paper_adapter(settings)
+    # The paper-search availability probe does not depend on the parse result,
+    # so let it run while MinerU uploads and polls.
+    search_state_task = asyncio.create_task(paper_adapter.get_search_runtime_state())
+    try:
+        parse_result = await mineru.parse_pdf(
+            pdf_path=source_pdf,
+            data_id=job_id,
+            pdf_bytes=source_pdf_bytes,
+        )
 
-    def apply_parsed(state):
-        state.artifacts.mineru_markdown_path = str(artifacts['mineru_markdown'])
-        state.artifacts.mineru_content_list_path = (
-            str(artifacts['mineru_content_list']) if Path(artifacts['mineru_content_list']).exists() else None
+        artifact_writes = [
+            asyncio.to_thread(write_text_atomic, Path(artifacts['mineru_markdown']), parse_result.markdown),
+        ]
+        if parse_result.content_list is not None:
+            artifact_writes.append(
+                asyncio.to_thread(
+                    write_json_atomic,
+                    Path(artifacts['mineru_content_list']),
+                    {'content_list': parse_result.content_list},
+                )
+            )
+        if parse_result.raw_result is not None:
+            artifact_writes.append(
+                asyncio.to_thread(
+                    write_json_atomic,
+                    Path(artifacts['raw_result']),
+                    parse_result.raw_result,
+                    durable=False,
+                )
+            )
+        # Build the page index while the artifact writes are in flight; both only read parse_result.
+        page_index, *_ = await asyncio.gather(
+            asyncio.to_thread(build_page_index, parse_result.markdown, parse_result.content_list),
+            *artifact_writes,
         )
-        state.artifacts.annotations_path = str(artifacts['annotations'])
-        state.metadata['markdown_provider'] = parse_result.provider
-        state.metadata['mineru_batch_id'] = parse_result.batch_id
-        state.metadata['parse_warning'] = parse_result.warning
+        # The raw MinerU payload is only persisted; do not keep it alive through the agent run.
+        parse_result.raw_result = None
 
-    mutate_job_state(job_id, apply_parsed)
-    if parse_result.warning:
-        append_event(job_id, 'markdown_parse_warning', warning=parse_result.warning, provider=parse_result.provider)
+        def apply_parsed(state):
+            state.artifacts.mineru_markdown_path = str(artifacts['mineru_markdown'])
+            state.artifacts.mineru_content_list_path = (
+                str(artifacts['mineru_content_list']) if Path(artifacts['mineru_content_list']).exists() else None
+            )
+            state.artifacts.annotations_path = str(artifacts['annotations'])
+            state.metadata['markdown_provider'] = parse_result.provider
+            state.metadata['mineru_batch_id'] = parse_result.batch_id
+            state.metadata['parse_warning'] = parse_result.warning
+
+        mutate_job_state(job_id, apply_parsed)
+        if parse_result.warning:
+            append_event(job_id, 'markdown_parse_warning', warning=parse_result.warning, provider=parse_result.provider)
 
-    page_index = build_page_index(parse_result.markdown, parse_result.content_list)
+        set_status(job_id, JobStatus.agent_running, 'Running review agent with tool loop...')
 
-    set_status(job_id, JobStatus.agent_running, 'Running review agent with tool loop...')
+        paper_search_runtime_state = (await search_state_task).to_dict()
+    finally:
+        # Any failure before the probe is awaited must not leave it running unobserved.
+        if not search_state_task.done():
+            search_state_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await search_state_task
 
-    paper_adapter = _build_paper_adapter()
-    paper_search_runtime_state = (await paper_adapter.get_search_runtime_state()).to_dict()
     append_event(
         job_id,
         'paper_search_runtime_state_resolved',
@@ -387,13 +530,6 @@ async def run_job_async(job_id: str) -> None:
         error=paper_search_runtime_state.get('error'),
     )
 
-    def apply_paper_search_state(state):
-        metadata = dict(state.metadata)
-        metadata['paper_search_runtime_state'] = dict(paper_search_runtime_state)
-        state.metadata = metadata
-
-    mutate_job_state(job_id, apply_paper_search_state)
-
     prompt = build_review_agent_system_prompt(
         source_file_id=job_id,
         source_file_name=job.source_pdf_name,
@@ -402,9 +538,12 @@ async def run_job_async(job_id: str) -> None:
         use_meta_review=False,
         paper_search_runtime_state=paper_search_runtime_state,
     )
-    write_text_atomic(Path(artifacts['prompt_snapshot']), prompt)
+    await asyncio.to_thread(write_text_atomic, Path(artifacts['prompt_snapshot']), prompt, durable=False)
 
     def apply_prompt(state):
+        metadata = dict(state.metadata)
+        metadata['paper_search_runtime_state'] = dict(paper_search_runtime_state)
+        state.metadata = metadata
         state.artifacts.prompt_snapshot_path = str(artifacts['prompt_snapshot'])
 
     mutate_job_state(job_id, apply_prompt)
@@ -420,13 +559,15 @@ async def run_job_async(job_id: str) -> None:
     )
 
     tools = build_review_tools(runtime)
-    agent_model = _build_agent_model()
+    openai_client = _build_openai_client(settings)
+    agent_model = _build_agent_model(settings, openai_client=openai_client)
+    base_model_settings = _build_agent_model_settings(settings=settings)
     agent = Agent(
         name='DeepReviewer2Agent',
         instructions=prompt,
         tools=tools,
         model=agent_model,
-        model_settings=_build_agent_model_settings(),
+        model_settings=base_model_settings,
     )
 
     requested_attempts = int(settings.agent_resume_attempts)
@@ -439,7 +580,7 @@ async def run_job_async(job_id: str) -> None:
             applied=max_attempts,
             reason='hard_cap_2',
         )
-    run_config = _build_run_config()
+    run_config = _build_run_config(settings, openai_client=openai_client)
     # Use the exact same full review prompt as user input (parity requirement).
     next_input: str | list[Any] = prompt
     usage_totals = {
@@ -449,22 +590,30 @@ async def run_job_async(job_id: str) -> None:
         'total_tokens': 0,
     }
 
-    def _consume_run_result(run_result: Any, *, output_tag: str) -> str:
+    async def _consume_run_result(run_result: Any, *, output_tag: str) -> str:
         usage = run_result.context_wrapper.usage
         usage_totals['requests'] += int(getattr(usage, 'requests', 0) or 0)
         usage_totals['input_tokens'] += int(getattr(usage, 'input_tokens', 0) or 0)
         usage_totals['output_tokens'] += int(getattr(usage, 'output_tokens', 0) or 0)
         usage_totals['total_tokens'] += int(getattr(usage, 'total_tokens', 0) or 0)
         usage_payload = SimpleNamespace(**usage_totals)
-        _sync_token_usage(job_id, usage_payload)
         runtime.sync_state_usage(usage_payload)
 
         final_output_text = str(run_result.final_output or '').strip()
         if final_output_text:
-            write_text_atomic(Path(runtime.job_dir / 'agent_final_output.txt'), final_output_text)
-            write_text_atomic(
-                Path(runtime.job_dir / f'agent_final_output_{output_tag}.txt'),
-                final_output_text,
+            await asyncio.gather(
+                asyncio.to_thread(
+                    write_text_atomic,
+                    Path(runtime.job_dir / 'agent_final_output.txt'),
+                    final_output_text,
+                    durable=False,
+                ),
+                asyncio.to_thread(
+                    write_text_atomic,
+                    Path(runtime.job_dir / f'agent_final_output_{output_tag}.txt'),
+                    final_output_text,
+                    durable=False,
+                ),
             )
         return final_output_text
 
@@ -487,46 +636,7 @@ async def run_job_async(job_id: str) -> None:
                 run_config=run_config,
             )
         )
-        run_result = None
-        while True:
-            done, _ = await asyncio.wait({run_task}, timeout=0.5)
-            if run_task in done:
-                try:
-                    run_result = run_task.result()
-                except Exception as exc:
-                    if runtime.final_markdown_text:
-                        append_event(
-                            job_id,
-                            'agent_run_post_final_exception_ignored',
-                            attempt=attempt,
-                            error=f'{type(exc).__name__}: {exc}',
-                            reason='final_report_already_persisted',
-                        )
-                        run_result = None
-                        break
-                    raise
-                break
-            if runtime.final_markdown_text:
-                run_task.cancel()
-                append_event(
-                    job_id,
-                    'agent_run_cancelled_after_final_write',
-                    attempt=attempt,
-                    reason='final_report_already_persisted',
-                )
-                try:
-                    await run_task
-                except asyncio.CancelledError:
-                    pass
-                except Exception as exc:
-                    append_event(
-                        job_id,
-                        'agent_run_cancel_post_final_exception_ignored',
-                        attempt=attempt,
-                        error=f'{type(exc).__name__}: {exc}',
-                        reason='final_report_already_persisted',
-                    )
-                break
+        run_result = await _await_run_or_final_write(job_id, runtime, run_task, attempt=attempt)
 
         if run_result is None and runtime.final_markdown_text:
             append_event(
@@ -537,7 +647,7 @@ async def run_job_async(job_id: str) -> None:
             )
             break
 
-        _consume_run_result(run_result, output_tag=f'attempt_{attempt}')
+        await _consume_run_result(run_result, output_tag=f'attempt_{attempt}')
 
         if runtime.final_markdown_text:
             break
@@ -557,21 +667,20 @@ async def run_job_async(job_id: str) -> None:
                 attempt=attempt,
                 reason='max_attempt_reached_without_final_write',
             )
-            forced_input = [
-                *run_result.to_input_list(),
-                {
-                    'role': 'user',
-                    'content': (
-                        'MANDATORY ACTION NOW: Call review_final_markdown_write in section mode immediately. '
-                        'Submit exactly one required section per call using '
-                        'review_final_markdown_write(section_id=<required_section_id>, section_content=<section_markdown>). '
-                        'After each call, inspect completed_sections/missing_sections/next_required_section and '
-                        'submit the next required section right away until status=ok. '
-                        'Do not output plain-text final report. If the tool returns retry_required/error, '
-                        'follow message/next_steps and retry review_final_markdown_write.'
-                    ),
-                },
-            ]
+            forced_input = _continuation_input(
+                run_result,
+                (
+                    'MANDATORY ACTION NOW: Call review_final_markdown_write in section mode immediately. '
+                    'Submit exactly one required section per call using '
+                    'review_final_markdown_write(section_id=<required_section_id>, section_content=<section_markdown>). '
+                    'After each call, inspect completed_sections/missing_sections/next_required_section and '
+                    'submit the next required section right away until status=ok. '
+                    'Do not output plain-text final report. If the tool returns retry_required/error, '
+                    'follow message/next_steps and retry review_final_markdown_write.'
+                ),
+            )
+            # Sequential on purpose: both enforcers share the runtime's section-write
+            # state, and the fallback continues from the first attempt's transcript.
             forced_choices = ['review_final_markdown_write', 'required']
             for forced_choice in forced_choices:
                 if runtime.final_markdown_text:
@@ -584,12 +693,9 @@ async def run_job_async(job_id: str) -> None:
                     )
                     break
                 try:
-                    forced_agent = Agent(
+                    forced_agent = agent.clone(
                         name='DeepReviewer2AgentFinalWriteEnforcer',
-                        instructions=prompt,
-                        tools=tools,
-                        model=agent_model,
-                        model_settings=_build_agent_model_settings(tool_choice=forced_choice),
+                        model_settings=dataclasses.replace(base_model_settings, tool_choice=forced_choice),
                     )
                     forced_result = await Runner.run(
                         forced_agent,
@@ -605,7 +711,7 @@ async def run_job_async(job_id: str) -> None:
                             'agent_forced_final_write_post_success_exception_ignored',
                             attempt=attempt,
                             tool_choice=forced_choice,
-                            error=f'{type(exc).__name__}: {exc}',
+                            error=_exception_label(exc),
                             reason='final_report_already_persisted',
                         )
                         break
@@ -614,11 +720,11 @@ async def run_job_async(job_id: str) -> None:
                         'agent_forced_final_write_error',
                         attempt=attempt,
                         tool_choice=forced_choice,
-                        error=f'{type(exc).__name__}: {exc}',
+                        error=_exception_label(exc),
                     )
                     continue
 
-                forced_output_text = _consume_run_result(
+                forced_output_text = await _consume_run_result(
                     forced_result,
                     output_tag=f'attempt_{attempt}_forced_final_write',
                 )
@@ -632,16 +738,13 @@ async def run_job_async(job_id: str) -> None:
                 )
                 if runtime.final_markdown_text:
                     break
-                forced_input = [
-                    *forced_result.to_input_list(),
-                    {
-                        'role': 'user',
-                        'content': (
-                            'The final report is still not persisted. Continue section-mode submission now: '
-                            'call review_final_markdown_write with section_id + section_content for the next required section.'
-                        ),
-                    },
-                ]
+                forced_input = _continuation_input(
+                    forced_result,
+                    (
+                        'The final report is still not persisted. Continue section-mode submission now: '
+                        'call review_final_markdown_write with section_id + section_content for the next required section.'
+                    ),
+                )
 
             break
 
@@ -670,13 +773,7 @@ async def run_job_async(job_id: str) -> None:
             'perform minimal remediation, then retry review_final_markdown_write.\n'
             'Never end this run without a successful review_final_markdown_write.'
         )
-        next_input = [
-            *run_result.to_input_list(),
-            {
-                'role': 'user',
-                'content': continuation_instruction,
-            },
-        ]
+        next_input = _continuation_input(run_result, continuation_instruction)
 
     if not runtime.final_markdown_text:
         raise RuntimeError(
@@ -703,25 +800,34 @@ async def run_job_async(job_id: str) -> None:
             int(token_usage_for_pdf['input_tokens']) + int(token_usage_for_pdf['output_tokens'])
         )
 
-    _render_report_pdf(
-        job_id=job_id,
-        job_title=job.title,
-        source_pdf_name=job.source_pdf_name,
-        final_md_path=final_md_path,
-        source_pdf_path=source_pdf,
-        report_pdf_path=report_pdf_path,
-        annotations=list(runtime.annotations),
-        content_list=parse_result.content_list,
-        token_usage=token_usage_for_pdf,
-        agent_model=str(settings.agent_model or '').strip(),
+    pdf_task = asyncio.create_task(
+        asyncio.to_thread(
+            _render_report_pdf,
+            job_id=job_id,
+            job_title=job.title,
+            source_pdf_name=job.source_pdf_name,
+            final_md_path=final_md_path,
+            source_pdf_path=source_pdf,
+            report_pdf_path=report_pdf_path,
+            annotations=list(runtime.annotations),
+            content_list=parse_result.content_list,
+            token_usage=token_usage_for_pdf,
+            agent_model=str(settings.agent_model or '').strip(),
+            final_markdown_text=runtime.final_markdown_text,
+            source_pdf_bytes=source_pdf_bytes,
+        )
     )
 
+    # The agent is done with the model client; release its connection pool while the PDF renders.
+    await openai_client.close()
+    await pdf_task
+
     def apply_completed(state):
         state.status = JobStatus.completed
         state.message = 'Review pipeline completed.'
         state.error = None
         state.final_report_ready = True
-        state.pdf_ready = report_pdf_path.exists()
+        state.pdf_ready = True
         state.artifacts.final_markdown_path = str(final_md_path)
         state.artifacts.report_pdf_path = str(report_pdf_path)
 
@@ -743,3 +849,12 @@ def run_job(job_id: str) -> None:
             message='Review pipeline failed.',
             error=detail,
         )
+    finally:
+        close_events(job_id)
+        # A failed state write must not replace the pipeline's own exception; entries that
+        # could not be written stay buffered for the flusher and the exit-time flush.
+        try:
+            flush_job_states()
+        except OSError as exc:
+            logger.warning('Failed to write buffered job state for %s: %s', job_id, exc)
+        flush_durability()
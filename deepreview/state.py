@@ -1,100 +1,263 @@
 from __future__ import annotations
 
+import atexit
+import logging
+import os
 import shutil
 import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 from uuid import UUID
 
-from .storage import append_event, job_dir, read_json, state_path, write_json_atomic
+from .storage import _safe_job_id, append_event, close_events, job_dir, state_path, write_bytes_atomic
 from .types import JobState, JobStatus
 
 
+logger = logging.getLogger(__name__)
+
 _STATE_LOCK = threading.RLock()
+_LOAD_RETRY_DELAY_SECONDS = 0.05
+# Last state written by this process, keyed by job id. Guarded by _STATE_LOCK.
+# The job worker is the only writer while a job runs, so updates can skip re-reading job.json.
+_STATE_CACHE: dict[str, JobState] = {}
+# Serialized job.json bodies not yet on disk, keyed by state path. Guarded by _STATE_LOCK.
+# Non-terminal updates are written back at most once per flush interval.
+_STATE_FLUSH_INTERVAL_SECONDS = 0.05
+# Failed background flushes back off exponentially up to this delay between retries.
+_STATE_FLUSH_MAX_RETRY_SECONDS = 30.0
+_PENDING_STATE_WRITES: dict[Path, bytes] = {}
+_STATE_FLUSH_WAKE = threading.Event()
+# Tests turn this off to flush explicitly instead of racing the background thread.
+_STATE_FLUSH_AUTOSTART = True
+_STATE_FLUSHER: threading.Thread | None = None
+_STATE_FLUSH_STOP = threading.Event()
+_TERMINAL_STATUSES = frozenset({JobStatus.completed, JobStatus.failed})
 
 
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def flush_job_states() -> None:
+    """Write every buffered job state to disk now.
+
+    Entries are dropped only after their write succeeds; failed ones stay buffered and the
+    first error is re-raised once every other entry has been attempted.
+    """
+    first_error: OSError | None = None
+    with _STATE_LOCK:
+        for path, data in list(_PENDING_STATE_WRITES.items()):
+            try:
+                write_bytes_atomic(path, data)
+            except OSError as exc:
+                if first_error is None:
+                    first_error = exc
+                continue
+            _PENDING_STATE_WRITES.pop(path, None)
+    if first_error is not None:
+        raise first_error
+
+
+def _state_flush_loop(stop: threading.Event) -> None:
+    delay = _STATE_FLUSH_INTERVAL_SECONDS
+    while not stop.is_set():
+        _STATE_FLUSH_WAKE.wait()
+        # Coalesce the updates of one interval; while writes keep failing, wait longer.
+        stop.wait(delay)
+        _STATE_FLUSH_WAKE.clear()
+        try:
+            flush_job_states()
+        except OSError as exc:
+            if delay == _STATE_FLUSH_INTERVAL_SECONDS:
+                logger.warning('Failed to write buffered job state, retrying with backoff: %s', exc)
+            else:
+                logger.debug('Buffered job state write still failing: %s', exc)
+            delay = min(delay * 2, _STATE_FLUSH_MAX_RETRY_SECONDS)
+            _STATE_FLUSH_WAKE.set()
+        else:
+            delay = _STATE_FLUSH_INTERVAL_SECONDS
+
+
+def _stop_state_flusher() -> None:
+    global _STATE_FLUSHER
+    with _STATE_LOCK:
+        flusher = _STATE_FLUSHER
+        stop = _STATE_FLUSH_STOP
+        _STATE_FLUSHER = None
+    if flusher is None:
+        return
+    stop.set()
+    _STATE_FLUSH_WAKE.set()
+    # Joined outside the lock: the flusher's last pass takes it.
+    flusher.join()
+
+
+atexit.register(flush_job_states)
+
+
+def _write_state(job: JobState, *, immediate: bool = False) -> None:
+    global _STATE_FLUSHER, _STATE_FLUSH_STOP
+    # Serialize in pydantic-core directly instead of building a dict for json.dumps.
+    # Every optional JobState field defaults to None, so omitted keys reload unchanged;
+    # exclude_none does not reach into the free-form metadata dict.
+    data = job.model_dump_json(indent=2, exclude_none=True).encode('utf-8')
+    path = state_path(job.id)
+    _STATE_CACHE[str(job.id)] = job
+    if immediate or job.status in _TERMINAL_STATUSES:
+        _PENDING_STATE_WRITES.pop(path, None)
+        write_bytes_atomic(path, data)
+        return
+    # The bytes are a snapshot, so later in-place mutations cannot leak into the pending write.
+    _PENDING_STATE_WRITES[path] = data
+    if _STATE_FLUSHER is None and _STATE_FLUSH_AUTOSTART:
+        _STATE_FLUSH_STOP = threading.Event()
+        _STATE_FLUSHER = threading.Thread(
+            target=_state_flush_loop,
+            args=(_STATE_FLUSH_STOP,),
+            name='deepreview-state',
+            daemon=True,
+        )
+        _STATE_FLUSHER.start()
+    _STATE_FLUSH_WAKE.set()
+
+
 def save_job_state(job: JobState) -> JobState:
     with _STATE_LOCK:
         job.updated_at = now_utc()
-        write_json_atomic(state_path(job.id), job.model_dump(mode='json'))
+        # Saves create jobs that a freshly spawned worker reads from disk. The cache gets its
+        # own copy so later edits to the caller's object are never written by other updates.
+        _write_state(job.model_copy(deep=True), immediate=True)
     return job
 
 
-def load_job_state(job_id: UUID | str) -> JobState | None:
+def _load_unlocked(job_id: UUID | str) -> JobState | None:
     try:
         path = state_path(job_id)
     except ValueError:
         return None
+    pending = _PENDING_STATE_WRITES.get(path)
+    if pending is not None:
+        return JobState.model_validate_json(pending)
     if not path.exists():
         return None
+    return JobState.model_validate_json(path.read_bytes())
+
+
+def load_job_state(job_id: UUID | str) -> JobState | None:
+    # Reads never use _STATE_CACHE: pollers in other processes rely on job.json, and in-process
+    # readers get buffered writes from their serialized bytes, as fresh objects.
+    # job.json is only ever replaced by rename, so readers cannot see a torn file and take no lock.
+    try:
+        return _load_unlocked(job_id)
+    except (FileNotFoundError, ValueError):
+        time.sleep(_LOAD_RETRY_DELAY_SECONDS)
+        return _load_unlocked(job_id)
+
+
+def _load_for_write(job_id: UUID | str) -> JobState:
+    try:
+        key = _safe_job_id(job_id)
+    except ValueError:
+        key = None
+    existing = _STATE_CACHE.get(key) if key is not None else None
+    if existing is None:
+        existing = _load_unlocked(job_id)
+    if existing is None:
+        raise FileNotFoundError(f'Job not found: {job_id}')
+    return existing
+
+
+def _update_job_state_at(job_id: UUID | str, now: datetime, fields: dict[str, Any]) -> JobState:
     with _STATE_LOCK:
-        payload = read_json(path)
-    return JobState.model_validate(payload)
+        existing = _load_for_write(job_id)
+        try:
+            for key, value in fields.items():
+                setattr(existing, key, value)
+            existing.updated_at = now
+            _write_state(existing)
+        except BaseException:
+            _STATE_CACHE.pop(str(existing.id), None)
+            raise
+        # The cached object is the base for the next write; callers get their own copy.
+        return existing.model_copy(deep=True)
 
 
 def update_job_state(job_id: UUID | str, **fields: Any) -> JobState:
-    with _STATE_LOCK:
-        existing = load_job_state(job_id)
-        if existing is None:
-            raise FileNotFoundError(f'Job not found: {job_id}')
-        for key, value in fields.items():
-            setattr(existing, key, value)
-        existing.updated_at = now_utc()
-        write_json_atomic(state_path(job_id), existing.model_dump(mode='json'))
-    return existing
+    return _update_job_state_at(job_id, now_utc(), fields)
 
 
 def mutate_job_state(job_id: UUID | str, fn: Callable[[JobState], None]) -> JobState:
     with _STATE_LOCK:
-        existing = load_job_state(job_id)
-        if existing is None:
-            raise FileNotFoundError(f'Job not found: {job_id}')
-        fn(existing)
-        existing.updated_at = now_utc()
-        write_json_atomic(state_path(job_id), existing.model_dump(mode='json'))
-    return existing
+        existing = _load_for_write(job_id)
+        try:
+            fn(existing)
+            existing.updated_at = now_utc()
+            _write_state(existing)
+        except BaseException:
+            # Drop a possibly half-applied in-memory state; the next write reloads from disk.
+            _STATE_CACHE.pop(str(existing.id), None)
+            raise
+        return existing.model_copy(deep=True)
 
 
 def set_status(job_id: UUID | str, status: JobStatus, message: str, *, event: str | None = None) -> JobState:
-    job = update_job_state(job_id, status=status, message=message)
-    append_event(job_id, event or 'status', status=status.value, message=message)
+    # The state's updated_at and the event's ts share one timestamp.
+    now = now_utc()
+    job = _update_job_state_at(job_id, now, {'status': status, 'message': message})
+    append_event(job_id, event or 'status', ts=now, status=status.value, message=message)
     return job
 
 
 def fail_job(job_id: UUID | str, *, message: str, error: str) -> JobState:
-    job = update_job_state(job_id, status=JobStatus.failed, message=message, error=error)
-    append_event(job_id, 'failed', message=message, error=error)
+    now = now_utc()
+    job = _update_job_state_at(
+        job_id,
+        now,
+        {'status': JobStatus.failed, 'message': message, 'error': error},
+    )
+    append_event(job_id, 'failed', ts=now, message=message, error=error)
     return job
 
 
+_ARTIFACT_FILENAMES = (
+    ('source_pdf', 'source.pdf'),
+    ('mineru_markdown', 'mineru_full.md'),
+    ('mineru_content_list', 'mineru_content_list.json'),
+    ('annotations', 'annotations.json'),
+    ('final_markdown', 'final_report.md'),
+    ('report_pdf', 'final_report.pdf'),
+    ('prompt_snapshot', 'agent_prompt.txt'),
+    ('raw_result', 'mineru_result_raw.json'),
+)
+
+
+@lru_cache(maxsize=1024)
+def _artifact_paths(root: Path) -> tuple[tuple[str, Path], ...]:
+    # Keyed by the job directory itself, so a changed data_dir never hits stale paths.
+    return tuple((key, root / filename) for key, filename in _ARTIFACT_FILENAMES)
+
+
 def ensure_artifact_paths(job_id: UUID | str) -> dict[str, Path]:
-    root = job_dir(job_id)
-    return {
-        'source_pdf': root / 'source.pdf',
-        'mineru_markdown': root / 'mineru_full.md',
-        'mineru_content_list': root / 'mineru_content_list.json',
-        'annotations': root / 'annotations.json',
-        'final_markdown': root / 'final_report.md',
-        'report_pdf': root / 'final_report.pdf',
-        'prompt_snapshot': root / 'agent_prompt.txt',
-        'raw_result': root / 'mineru_result_raw.json',
-    }
+    return dict(_artifact_paths(job_dir(job_id)))
 
 
 def reset_job_dir(job_id: UUID | str) -> None:
     root = job_dir(job_id)
-    for child in root.iterdir():
-        if child.name == 'job.json':
-            continue
-        if child.is_dir():
-            shutil.rmtree(child, ignore_errors=True)
-        else:
-            try:
-                child.unlink()
-            except Exception:
-                pass
+    close_events(job_id)
+    with _STATE_LOCK:
+        _STATE_CACHE.pop(root.name, None)
+        # scandir reports entry types from the directory listing, so no stat per child.
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name == 'job.json':
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
@@ -1,18 +1,68 @@
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import os
+import queue
+import threading
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from uuid import UUID
 
 from .config import get_settings
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json remains the fallback.
+    orjson = None
+
+_ORJSON_WRITE_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+_ORJSON_EVENT_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE) if orjson is not None else 0
+
+logger = logging.getLogger(__name__)
+
+_CREATED_DIRS: set[Path] = set()
+
+# Event lines are appended by one background writer so bursts share a single write per file.
+# Items are (events_file, line) pairs, (events_file, None) to close that file's handle,
+# or a threading.Event that flush_events() waits on.
+_EVENT_QUEUE: queue.SimpleQueue[tuple[Path, bytes | None] | threading.Event] = queue.SimpleQueue()
+# Append handles stay open between batches; only the writer thread touches them.
+_MAX_OPEN_EVENT_FILES = 64
+_EVENT_WRITER: threading.Thread | None = None
+_EVENT_WRITER_LOCK = threading.Lock()
+
+# Renamed files are fsynced individually, but their directories are fsynced together once per
+# window, so a burst of state updates pays a single directory fsync.
+_DIR_SYNC_WINDOW_SECONDS = 0.05
+_DIRTY_DIRS: set[Path] = set()
+_DIRTY_DIRS_LOCK = threading.Lock()
+_DIR_SYNC_WAKE = threading.Event()
+# Tests turn this off to sync explicitly instead of racing the background thread.
+_DIR_SYNC_AUTOSTART = True
+_DIR_SYNCER: threading.Thread | None = None
+_DIR_SYNC_STOP = threading.Event()
+
+
+def _ensure_dir(path: Path) -> Path:
+    # Directories created once in this process are not re-created on every lookup.
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+    return path
+
 
 def jobs_root() -> Path:
-    root = get_settings().data_dir / 'jobs'
-    root.mkdir(parents=True, exist_ok=True)
-    return root
+    return _ensure_dir(get_settings().data_dir / 'jobs')
+
+
+@lru_cache(maxsize=4096)
+def _safe_job_id_str(token: str) -> str:
+    # Only successful parses are cached; lru_cache does not memoize raised errors.
+    return str(UUID(token))
 
 
 def _safe_job_id(job_id: UUID | str) -> str:
@@ -22,15 +72,13 @@ def _safe_job_id(job_id: UUID | str) -> str:
     if not token:
         raise ValueError('job_id is required')
     try:
-        return str(UUID(token))
+        return _safe_job_id_str(token)
     except Exception as exc:
         raise ValueError(f'invalid job_id: {job_id}') from exc
 
 
 def job_dir(job_id: UUID | str) -> Path:
-    path = jobs_root() / _safe_job_id(job_id)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return _ensure_dir(jobs_root() / _safe_job_id(job_id))
 
 
 def state_path(job_id: UUID | str) -> Path:
@@ -45,32 +93,229 @@ def annotations_path(job_id: UUID | str) -> Path:
     return job_dir(job_id) / 'annotations.json'
 
 
-def write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+def _dump_json_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_WRITE_OPTIONS)
+        except TypeError:
+            # orjson rejects a few values stdlib json accepts (e.g. ints beyond 64 bits).
+            pass
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _json_datetime_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _dump_event_line(row: dict[str, Any]) -> bytes:
+    # orjson formats datetimes natively, byte-for-byte like datetime.isoformat().
+    if orjson is not None:
+        try:
+            return orjson.dumps(row, option=_ORJSON_EVENT_OPTIONS)
+        except TypeError:
+            pass
+    line = json.dumps(row, ensure_ascii=False, default=_json_datetime_default)
+    return (line + '\n').encode('utf-8')
+
+
+def _fsync_dir(path: Path) -> None:
+    if not hasattr(os, 'O_DIRECTORY'):
+        # Directories cannot be opened for fsync on Windows.
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as exc:
+        logger.warning('Failed to open %s for fsync: %s', path, exc)
+        return
+    try:
+        os.fsync(fd)
+    except OSError as exc:
+        logger.warning('Failed to fsync directory %s: %s', path, exc)
+    finally:
+        os.close(fd)
+
+
+def flush_durability() -> None:
+    """Fsync every directory that has had a file renamed into it since the last sync."""
+    with _DIRTY_DIRS_LOCK:
+        dirty = list(_DIRTY_DIRS)
+        _DIRTY_DIRS.clear()
+    for path in dirty:
+        _fsync_dir(path)
+
+
+def _dir_sync_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        _DIR_SYNC_WAKE.wait()
+        stop.wait(_DIR_SYNC_WINDOW_SECONDS)
+        _DIR_SYNC_WAKE.clear()
+        flush_durability()
+
+
+def _stop_dir_syncer() -> None:
+    global _DIR_SYNCER
+    with _DIRTY_DIRS_LOCK:
+        syncer = _DIR_SYNCER
+        stop = _DIR_SYNC_STOP
+        _DIR_SYNCER = None
+    if syncer is None:
+        return
+    stop.set()
+    _DIR_SYNC_WAKE.set()
+    syncer.join()
+
+
+def _mark_dir_dirty(path: Path) -> None:
+    global _DIR_SYNCER, _DIR_SYNC_STOP
+    with _DIRTY_DIRS_LOCK:
+        _DIRTY_DIRS.add(path)
+        if _DIR_SYNCER is None and _DIR_SYNC_AUTOSTART:
+            _DIR_SYNC_STOP = threading.Event()
+            _DIR_SYNCER = threading.Thread(
+                target=_dir_sync_loop,
+                args=(_DIR_SYNC_STOP,),
+                name='deepreview-dirsync',
+                daemon=True,
+            )
+            _DIR_SYNCER.start()
+    _DIR_SYNC_WAKE.set()
+
+
+def write_bytes_atomic(path: Path, data: bytes, *, durable: bool = True) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if not durable:
+        # Regenerable artifacts skip the temp file + rename; a crash may leave them truncated.
+        path.write_bytes(data)
+        return
     tmp = path.with_suffix(path.suffix + '.tmp')
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+    with tmp.open('wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
     tmp.replace(path)
+    _mark_dir_dirty(path.parent)
 
 
-def write_text_atomic(path: Path, content: str) -> None:
+def write_json_atomic(path: Path, payload: dict[str, Any], *, durable: bool = True) -> None:
+    write_bytes_atomic(path, _dump_json_bytes(payload), durable=durable)
+
+
+def write_text_atomic(path: Path, content: str, *, durable: bool = True) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if not durable:
+        path.write_text(content, encoding='utf-8')
+        return
     tmp = path.with_suffix(path.suffix + '.tmp')
-    tmp.write_text(content, encoding='utf-8')
+    with tmp.open('w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
     tmp.replace(path)
+    _mark_dir_dirty(path.parent)
 
 
 def read_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding='utf-8'))
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files written by stdlib json may carry NaN/Infinity literals.
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+def _close_event_file(handles: dict[Path, BinaryIO], events_file: Path) -> None:
+    handle = handles.pop(events_file, None)
+    if handle is None:
+        return
+    try:
+        handle.close()
+    except OSError as exc:
+        logger.warning('Failed to close %s: %s', events_file, exc)
+
+
+def _write_event_lines(pending: dict[Path, list[bytes]], handles: dict[Path, BinaryIO]) -> None:
+    for events_file, lines in pending.items():
+        try:
+            handle = handles.get(events_file)
+            if handle is None:
+                if len(handles) >= _MAX_OPEN_EVENT_FILES:
+                    _close_event_file(handles, next(iter(handles)))
+                handle = events_file.open('ab')
+                handles[events_file] = handle
+            handle.write(b''.join(lines))
+            handle.flush()
+        except OSError as exc:
+            logger.warning('Failed to append %d event(s) to %s: %s', len(lines), events_file, exc)
+            _close_event_file(handles, events_file)
+    pending.clear()
+
+
+def _event_writer_loop() -> None:
+    pending: dict[Path, list[bytes]] = {}
+    handles: dict[Path, BinaryIO] = {}
+    while True:
+        item = _EVENT_QUEUE.get()
+        while True:
+            if isinstance(item, threading.Event):
+                _write_event_lines(pending, handles)
+                item.set()
+            else:
+                events_file, line = item
+                if line is None:
+                    _write_event_lines(pending, handles)
+                    _close_event_file(handles, events_file)
+                else:
+                    pending.setdefault(events_file, []).append(line)
+            try:
+                item = _EVENT_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+        _write_event_lines(pending, handles)
+
+
+def _ensure_event_writer() -> None:
+    global _EVENT_WRITER
+    if _EVENT_WRITER is not None:
+        return
+    with _EVENT_WRITER_LOCK:
+        if _EVENT_WRITER is None:
+            writer = threading.Thread(target=_event_writer_loop, name='deepreview-events', daemon=True)
+            writer.start()
+            _EVENT_WRITER = writer
+
+
+def flush_events(timeout: float | None = 10.0) -> None:
+    """Block until every event queued so far has been written to disk."""
+    if _EVENT_WRITER is None:
+        return
+    done = threading.Event()
+    _EVENT_QUEUE.put(done)
+    if not done.wait(timeout):
+        logger.warning('Timed out after %ss waiting for queued events to flush', timeout)
+
+
+def close_events(job_id: UUID | str) -> None:
+    """Write the job's queued events and release its cached events.jsonl handle."""
+    if _EVENT_WRITER is None:
+        return
+    _EVENT_QUEUE.put((events_path(job_id), None))
+    flush_events()
+
+
+atexit.register(flush_events)
+atexit.register(flush_durability)
 
 
-def append_event(job_id: UUID | str, event: str, **extra: Any) -> None:
-    now = datetime.now(timezone.utc).isoformat()
+def append_event(job_id: UUID | str, event: str, *, ts: datetime | None = None, **extra: Any) -> None:
     row = {
-        'ts': now,
+        'ts': ts if ts is not None else datetime.now(timezone.utc),
         'event': event,
         **extra,
     }
     events_file = events_path(job_id)
-    events_file.parent.mkdir(parents=True, exist_ok=True)
-    with events_file.open('a', encoding='utf-8') as f:
-        f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    _ensure_event_writer()
+    _EVENT_QUEUE.put((events_file, _dump_event_line(row)))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -62,6 +65,8 @@ _RETRIEVAL_DISABLED_REFERENCES_NOTE = (
     'External literature search was not started in this run; no external references are listed.'
 )
 _FINAL_REPORT_SECTION_HEADING_PATTERN = re.compile(r'^\s{0,3}#{1,6}\s+(.+?)\s*$')
+_SECTION_TOKEN_NON_ALNUM_PATTERN = re.compile(r'[^0-9a-z\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
 _REQUIRED_FINAL_REPORT_SECTIONS: list[tuple[str, str, tuple[str, ...]]] = [
     ('summary', 'Summary', ('summary',)),
     ('strengths', 'Strengths', ('strengths',)),
@@ -99,6 +104,11 @@ _REQUIRED_FINAL_REPORT_SECTIONS: list[tuple[str, str, tuple[str, ...]]] = [
 ]
 
 
+def _paper_search_usage_payload(usage: PaperSearchUsage) -> dict[str, int]:
+    # PaperSearchUsage holds only int counters, so its __dict__ is exactly model_dump().
+    return dict(usage.__dict__)
+
+
 def _paper_search_state_payload(state: Any) -> dict[str, Any]:
     if not isinstance(state, dict):
         return {}
@@ -182,6 +192,35 @@ def _flatten_page_index(page_index: dict[int, list[str]]) -> list[tuple[int, int
     return rows
 
 
+def _search_lines(
+    rows: list[tuple[int, int, str, str]],
+    query: str,
+    top_k: int | None,
+) -> list[dict[str, Any]]:
+    tokens = [tok for tok in _WHITESPACE_PATTERN.split(query.lower()) if tok]
+    if not tokens:
+        tokens = [query.lower()]
+
+    # One C-level scan rejects lines without any token; exact per-token counts are only
+    # computed for the few lines that pass. A line containing the whole query contains
+    # every token, so no separate full-query check is needed.
+    prefilter = re.compile('|'.join(re.escape(tok) for tok in tokens))
+    # Negated scores let heapq pick the best lines by natural tuple order; (page, line) is
+    # unique, so ties never fall through to comparing text.
+    scored: list[tuple[int, int, int, str]] = []
+    for page, line_no, line_text, hay in rows:
+        if prefilter.search(hay) is None:
+            continue
+        score = sum(hay.count(tok) for tok in tokens)
+        scored.append((-score, page, line_no, line_text))
+
+    limit = max(1, min(50, int(top_k or 8)))
+    return [
+        {'page': p, 'line': ln, 'score': -neg_score, 'text': t}
+        for neg_score, p, ln, t in heapq.nsmallest(limit, scored)
+    ]
+
+
 def _coerce_markdown_text(value: Any) -> str:
     if value is None:
         return ''
@@ -217,20 +256,20 @@ def _normalize_final_report_section_token(value: Any) -> str:
     token = token.replace('\\', ' ')
     token = token.replace('_', ' ')
     token = token.replace('-', ' ')
-    token = re.sub(r'[^0-9a-z\s]', ' ', token)
-    token = re.sub(r'\s+', ' ', token).strip()
+    token = _SECTION_TOKEN_NON_ALNUM_PATTERN.sub(' ', token)
+    token = _WHITESPACE_PATTERN.sub(' ', token).strip()
     return token
 
 
-def _required_final_report_section_order() -> list[str]:
-    return [section_id for section_id, _title, _aliases in _REQUIRED_FINAL_REPORT_SECTIONS]
-
-
-def _required_final_report_section_titles() -> dict[str, str]:
-    return {section_id: title for section_id, title, _aliases in _REQUIRED_FINAL_REPORT_SECTIONS}
+_FINAL_REPORT_SECTION_ORDER: tuple[str, ...] = tuple(
+    section_id for section_id, _title, _aliases in _REQUIRED_FINAL_REPORT_SECTIONS
+)
+_FINAL_REPORT_SECTION_TITLES: dict[str, str] = {
+    section_id: title for section_id, title, _aliases in _REQUIRED_FINAL_REPORT_SECTIONS
+}
 
 
-def _required_final_report_alias_map() -> dict[str, str]:
+def _build_final_report_alias_map() -> dict[str, str]:
     alias_map: dict[str, str] = {}
     for section_id, title, aliases in _REQUIRED_FINAL_REPORT_SECTIONS:
         for raw_alias in (section_id, title, *aliases):
@@ -240,15 +279,31 @@ def _required_final_report_alias_map() -> dict[str, str]:
     return alias_map
 
 
+_FINAL_REPORT_ALIAS_MAP = _build_final_report_alias_map()
+
+
+def _required_final_report_section_order() -> list[str]:
+    return list(_FINAL_REPORT_SECTION_ORDER)
+
+
+def _required_final_report_section_titles() -> dict[str, str]:
+    return _FINAL_REPORT_SECTION_TITLES
+
+
 def _resolve_final_report_section_id(section_key: Any) -> str | None:
+    return _resolve_final_report_section_id_cached(str(section_key or ''))
+
+
+@lru_cache(maxsize=512)
+def _resolve_final_report_section_id_cached(section_key: str) -> str | None:
+    # Headings repeat across sections and reports; the alias map is fixed, so results are too.
     normalized = _normalize_final_report_section_token(section_key)
     if not normalized:
         return None
-    alias_map = _required_final_report_alias_map()
-    direct = alias_map.get(normalized)
+    direct = _FINAL_REPORT_ALIAS_MAP.get(normalized)
     if direct:
         return direct
-    for alias, section_id in alias_map.items():
+    for alias, section_id in _FINAL_REPORT_ALIAS_MAP.items():
         if alias and alias in normalized:
             return section_id
     return None
@@ -275,6 +330,8 @@ def _strip_leading_section_heading(*, section_id: str, content: str) -> str:
     if not lines:
         return text
     first = lines[0].strip()
+    if not first.startswith('#'):
+        return text
     matched = _FINAL_REPORT_SECTION_HEADING_PATTERN.match(first)
     if not matched:
         return text
@@ -343,7 +400,11 @@ def _extract_required_sections_from_markdown(markdown_text: str) -> dict[str, st
     section_buffers: dict[str, list[str]] = {}
     active_section_id: str | None = None
     for raw_line in str(markdown_text or '').splitlines():
-        heading_match = _FINAL_REPORT_SECTION_HEADING_PATTERN.match(raw_line)
+        # Most lines are body text; only run the heading regex on lines that open with '#'.
+        if raw_line.lstrip().startswith('#'):
+            heading_match = _FINAL_REPORT_SECTION_HEADING_PATTERN.match(raw_line)
+        else:
+            heading_match = None
         if heading_match:
             heading_text = heading_match.group(1)
             active_section_id = _resolve_final_report_section_id(heading_text)
@@ -464,6 +525,7 @@ class ReviewRuntimeContext:
 
     annotations: list[AnnotationItem] = field(default_factory=list)
     final_markdown_text: str | None = None
+    final_markdown_written: asyncio.Event = field(default_factory=asyncio.Event)
     final_report_draft_sections: dict[str, str] = field(default_factory=dict)
     final_report_draft_version: int = 0
 
@@ -473,6 +535,8 @@ class ReviewRuntimeContext:
 
     status_updates: list[dict[str, Any]] = field(default_factory=list)
 
+    _search_rows: list[tuple[int, int, str, str]] | None = field(default=None, init=False, repr=False)
+
     def record_tool(self, name: str) -> None:
         self.tool_counts[name] = int(self.tool_counts.get(name, 0)) + 1
 
@@ -480,6 +544,15 @@ class ReviewRuntimeContext:
     def annotation_count(self) -> int:
         return len(self.annotations)
 
+    def search_rows(self) -> list[tuple[int, int, str, str]]:
+        # page_index is fixed for the job, so flatten and lowercase it once for all searches.
+        if self._search_rows is None:
+            self._search_rows = [
+                (page, line_no, text, text.lower())
+                for page, line_no, text in _flatten_page_index(self.page_index)
+            ]
+        return self._search_rows
+
     def sync_state_usage(self, token_usage: Any | None = None) -> None:
         def apply(job):
             tool_counts = dict(self.tool_counts)
@@ -508,6 +581,7 @@ class ReviewRuntimeContext:
         final_path = self.job_dir / 'final_report.md'
         write_text_atomic(final_path, markdown)
         self.final_markdown_text = markdown
+        self.final_markdown_written.set()
 
         def apply(job):
             job.final_report_ready = True
@@ -560,26 +634,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
             rt.sync_state_usage(ctx.usage)
             return {'status': 'error', 'reason': 'empty_query', 'message': 'query is required'}
 
-        tokens = [tok for tok in re.split(r'\s+', text.lower()) if tok]
-        if not tokens:
-            tokens = [text.lower()]
-
-        rows = _flatten_page_index(rt.page_index)
-        scored: list[tuple[int, int, int, str]] = []
-        for page, line_no, line_text in rows:
-            hay = line_text.lower()
-            score = sum(hay.count(tok) for tok in tokens)
-            if score <= 0 and text.lower() not in hay:
-                continue
-            if score <= 0:
-                score = 1
-            scored.append((score, page, line_no, line_text))
-
-        scored.sort(key=lambda item: (-item[0], item[1], item[2]))
-        hits = [
-            {'page': p, 'line': ln, 'score': s, 'text': t}
-            for s, p, ln, t in scored[: max(1, min(50, int(top_k or 8)))]
-        ]
+        hits = _search_lines(rt.search_rows(), text, top_k)
 
         rt.sync_state_usage(ctx.usage)
         return {'status': 'ok', 'query': text, 'count': len(hits), 'hits': hits}
@@ -656,7 +711,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
             0 if retrieval_not_started else max(0, int(rt.settings.min_paper_search_calls_for_pdf_annotate))
         )
         current_search_calls = max(0, int(rt.paper_search_usage.total_calls))
-        paper_search_usage_payload = rt.paper_search_usage.model_dump()
+        paper_search_usage_payload = _paper_search_usage_payload(rt.paper_search_usage)
 
         if current_search_calls < required_search_calls:
             rt.sync_state_usage(ctx.usage)
@@ -907,7 +962,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
         )
 
         result_payload = dict(result)
-        usage_payload = rt.paper_search_usage.model_dump()
+        usage_payload = _paper_search_usage_payload(rt.paper_search_usage)
         required_for_annotate = (
             0 if _paper_search_not_started(rt.paper_search_runtime_state)
             else max(0, int(rt.settings.min_paper_search_calls_for_pdf_annotate))
@@ -1044,7 +1099,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                     'Stop calling review_final_markdown_write and end this run now.'
                 ),
                 'annotation_count': rt.annotation_count,
-                'paper_search_usage': usage.model_dump(),
+                'paper_search_usage': _paper_search_usage_payload(usage),
                 'paper_search_state': paper_search_state_payload,
                 'required_paper_search_calls': required_paper_calls,
                 'completed_sections': _section_descriptor_list(completed_section_ids),
@@ -1063,7 +1118,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                 reason=str(payload.get('reason') or '').strip(),
                 message=str(payload.get('message') or '').strip(),
                 annotation_count=rt.annotation_count,
-                paper_search_usage=usage.model_dump(),
+                paper_search_usage=_paper_search_usage_payload(usage),
                 missing_sections=payload.get('missing_sections'),
                 language=payload.get('language'),
                 english_words=payload.get('english_words'),
@@ -1197,7 +1252,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                 completed_section_ids=completed_section_ids,
                 missing_section_ids=missing_section_ids,
                 annotation_count=rt.annotation_count,
-                paper_search_usage=usage.model_dump(),
+                paper_search_usage=_paper_search_usage_payload(usage),
                 required_paper_search_calls=required_paper_calls,
                 required_annotation_count=required_annotations,
                 draft_version=draft_version,
@@ -1242,7 +1297,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                     completed_section_ids=completed_section_ids,
                     missing_section_ids=missing_section_ids,
                     annotation_count=rt.annotation_count,
-                    paper_search_usage=usage.model_dump(),
+                    paper_search_usage=_paper_search_usage_payload(usage),
                     required_paper_search_calls=required_paper_calls,
                     required_annotation_count=required_annotations,
                     draft_version=draft_version,
@@ -1268,7 +1323,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                     completed_section_ids=completed_section_ids,
                     missing_section_ids=missing_section_ids,
                     annotation_count=rt.annotation_count,
-                    paper_search_usage=usage.model_dump(),
+                    paper_search_usage=_paper_search_usage_payload(usage),
                     required_paper_search_calls=required_paper_calls,
                     required_annotation_count=required_annotations,
                     draft_version=draft_version,
@@ -1301,7 +1356,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                     completed_section_ids=completed_section_ids,
                     missing_section_ids=missing_section_ids,
                     annotation_count=rt.annotation_count,
-                    paper_search_usage=usage.model_dump(),
+                    paper_search_usage=_paper_search_usage_payload(usage),
                     required_paper_search_calls=required_paper_calls,
                     required_annotation_count=required_annotations,
                     draft_version=draft_version,
@@ -1345,7 +1400,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
                     completed_section_ids=completed_section_ids,
                     missing_section_ids=missing_section_ids,
                     annotation_count=rt.annotation_count,
-                    paper_search_usage=usage.model_dump(),
+                    paper_search_usage=_paper_search_usage_payload(usage),
                     required_paper_search_calls=required_paper_calls,
                     required_annotation_count=required_annotations,
                     draft_version=draft_version,
@@ -1381,7 +1436,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
             'final_report_persisted',
             source=normalized_source,
             annotation_count=rt.annotation_count,
-            paper_search_usage=usage.model_dump(),
+            paper_search_usage=_paper_search_usage_payload(usage),
             completed_sections=completed_section_ids,
             draft_version=draft_version,
         )
@@ -1413,7 +1468,7 @@ def build_review_tools(runtime: ReviewRuntimeContext) -> list[Any]:
             'auto_composed_from_sections': True,
             'message': 'Final report persisted successfully. End execution now.',
             'annotation_count': rt.annotation_count,
-            'paper_search_usage': usage.model_dump(),
+            'paper_search_usage': _paper_search_usage_payload(usage),
             'paper_search_state': paper_search_state_payload,
             'required_paper_search_calls': required_paper_calls,
             'source': normalized_source,
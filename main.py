@@ -11,7 +11,7 @@ from pathlib import Path
 from deepreview.config import get_settings
 from deepreview.runner import run_job
 from deepreview.state import ensure_artifact_paths, load_job_state, save_job_state
-from deepreview.storage import append_event, job_dir
+from deepreview.storage import append_event, flush_events, job_dir
 from deepreview.types import JobState, JobStatus
 
 
@@ -86,6 +86,8 @@ def _spawn_worker(job_id: str) -> int:
     stdout_path = logs_dir / 'worker.stdout.log'
     stderr_path = logs_dir / 'worker.stderr.log'
 
+    # The worker appends to the same events.jsonl; write our queued events first.
+    flush_events()
     stdout_f = stdout_path.open('ab')
     stderr_f = stderr_path.open('ab')
 
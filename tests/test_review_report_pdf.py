@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import io
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pymupdf as fitz
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from deepreview.report.review_report_pdf import (
+    _MergedIntervals,
+    _measure_text_width,
+    _parse_hex_color,
+    _register_overlay_measure_font,
+    _render_annotated_source_pdf,
+    _report_styles,
+    _resolve_callout_slots,
+    _resolve_report_fonts,
+    build_review_report_pdf,
+)
+
+
+def _source_pdf_bytes() -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    for line_no in range(30):
+        page.insert_text((50, 60 + line_no * 24), f'Line {line_no} lorem ipsum', fontsize=10)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _embedded_font_files(pdf_bytes: bytes) -> list[tuple[str, bytes]]:
+    fonts = []
+    with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+        for xref in range(1, doc.xref_length()):
+            if doc.xref_get_key(xref, 'Type')[1] != '/FontDescriptor':
+                continue
+            for key in ('FontFile', 'FontFile2', 'FontFile3'):
+                kind, value = doc.xref_get_key(xref, key)
+                if kind == 'xref':
+                    font_name = doc.xref_get_key(xref, 'FontName')[1]
+                    fonts.append((font_name, doc.xref_stream(int(value.split()[0]))))
+    return fonts
+
+
+def _long_annotations(count: int = 6) -> list[dict]:
+    annotations = []
+    for idx in range(count):
+        rect = {'x1': 10, 'y1': 10 + idx * 6, 'x2': 60, 'y2': 12 + idx * 6, 'width': 100, 'height': 100}
+        annotations.append(
+            {
+                'annotation_id': f'a{idx}',
+                'page_number': 1,
+                'object_type': 'issue',
+                'severity': 'major',
+                'review_item_id': f'R{idx}',
+                'comment': 'Long comment sentence about the method. ' * 40,
+                'rects': [rect],
+                'bounding_rect': rect,
+            }
+        )
+    return annotations
+
+
+def _build_report(**overrides):
+    kwargs = {
+        'workspace_title': 'T',
+        'source_pdf_name': 'p.pdf',
+        'run_id': 'run-1',
+        'status': 'completed',
+        'decision': None,
+        'estimated_cost': 0,
+        'actual_cost': None,
+        'exported_at': datetime(2024, 1, 1),
+        'meta_review': {},
+        'reviewers': [],
+        'raw_output': None,
+        'final_report_markdown': '## Summary\nHello',
+    }
+    kwargs.update(overrides)
+    return build_review_report_pdf(**kwargs)
+
+
+def _page_texts(pdf_bytes: bytes) -> list[str]:
+    with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+        return [page.get_text() for page in doc]
+
+
+class _UnseekableStream(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        raise io.UnsupportedOperation('tell')
+
+    def seek(self, *args) -> int:
+        raise io.UnsupportedOperation('seek')
+
+
+def test_merged_intervals_merge_overlapping_inserts():
+    occupied = _MergedIntervals()
+    occupied.insert(100.0, 150.0)
+    occupied.insert(10.0, 40.0)
+    occupied.insert(140.0, 200.0)
+    occupied.insert(40.0, 60.0)
+    occupied.insert(300.0, 300.0)
+
+    assert list(occupied) == [(10.0, 60.0), (100.0, 200.0)]
+
+
+def test_resolve_callout_slots_picks_nearest_free_range():
+    occupied = _MergedIntervals()
+    occupied.insert(100.0, 200.0)
+
+    top = _resolve_callout_slots(
+        lane_top=0.0,
+        lane_bottom=400.0,
+        preferred_top=150.0,
+        box_height=50.0,
+        occupied=occupied,
+        gap=5.0,
+    )
+
+    assert top == 205.0
+
+
+def test_parse_hex_color_accepts_only_six_hex_digits():
+    assert _parse_hex_color('#FF0080') == (1.0, 0.0, 128 / 255.0)
+    assert _parse_hex_color(' ff0080 ') == (1.0, 0.0, 128 / 255.0)
+    assert _parse_hex_color('#0x1234') is None
+    assert _parse_hex_color('ab_cde') is None
+    assert _parse_hex_color('#abc') is None
+    assert _parse_hex_color(None) is None
+
+
+def test_continuation_pages_keep_page_identity_label():
+    report = _build_report(source_pdf_bytes=_source_pdf_bytes(), source_annotations=_long_annotations())
+
+    texts = _page_texts(report)
+
+    assert any('PAGE ID: P001-C01' in text for text in texts)
+
+
+@pytest.mark.parametrize('with_source', [False, True])
+def test_stream_output_matches_returned_bytes(with_source):
+    overrides = {}
+    if with_source:
+        overrides = {'source_pdf_bytes': _source_pdf_bytes(), 'source_annotations': _long_annotations(2)}
+    expected = _page_texts(_build_report(**overrides))
+
+    for stream in (io.BytesIO(), _UnseekableStream()):
+        assert _build_report(output=stream, **overrides) is None
+        assert _page_texts(stream.getvalue()) == expected
+
+    assert len(expected) > (2 if with_source else 1)
+
+
+def test_minimal_cover_replaces_metadata_table_with_one_line():
+    with fitz.open(stream=_build_report(minimal_cover=True), filetype='pdf') as doc:
+        cover = doc[0]
+        text = cover.get_text()
+        tables = cover.find_tables().tables
+
+    assert 'Document No. run-1 · Work ID DS-RV-RUN1XXXXX · Status Completed' in text
+    assert 'Agent Model' not in text
+    assert tables == []
+
+
+def test_annotated_source_keeps_its_embedded_fonts_whole():
+    source = fitz.open()
+    for page_no in range(2):
+        page = source.new_page()
+        page.insert_font(fontname='F0', fontbuffer=fitz.Font('tiro').buffer)
+        page.insert_text((50, 60), f'Embedded source text {page_no}', fontname='F0', fontsize=11)
+    source_bytes = source.tobytes(garbage=3, deflate=True)
+    source.close()
+    (source_font,) = _embedded_font_files(source_bytes)
+
+    rendered = _render_annotated_source_pdf(source_bytes, _long_annotations(2))
+
+    output_fonts = _embedded_font_files(rendered)
+    # Only the overlay fonts are subsetted; the source font is copied once and unchanged.
+    assert [font for font in output_fonts if font[0] == source_font[0]] == [source_font]
+    texts = _page_texts(rendered)
+    assert 'Embedded source text 0' in texts[0]
+    assert any('Embedded source text 1' in text for text in texts)
+
+
+def test_nested_lists_leave_the_shared_stylesheet_untouched():
+    styles = _report_styles(_resolve_report_fonts())
+    style_names = set(styles.byName)
+    # Nine levels: one past the depth styles prebuilt into the sheet.
+    markdown = '## Summary\n' + ''.join(f"{'  ' * depth}- depth {depth}\n" for depth in range(9))
+
+    texts = _page_texts(_build_report(final_report_markdown=markdown))
+
+    assert set(styles.byName) == style_names
+    assert 'MarkdownBulletDepth2' in style_names
+    assert 'depth 8' in ''.join(texts)
+
+
+def test_re_registering_a_measure_font_drops_cached_widths(tmp_path):
+    fonts = tmp_path / 'fonts'
+    fonts.mkdir()
+    narrow = fonts / 'narrow.otf'
+    wide = fonts / 'wide.otf'
+    narrow.write_bytes(fitz.Font('tiro').buffer)
+    wide.write_bytes(fitz.Font('cour').buffer)
+    font_name = 'test-measure-font'
+
+    _register_overlay_measure_font(font_name, narrow)
+    narrow_width = _measure_text_width('iiiiiiii', font_name=font_name, font_size=10.0)
+    _register_overlay_measure_font(font_name, wide)
+    wide_width = _measure_text_width('iiiiiiii', font_name=font_name, font_size=10.0)
+
+    assert wide_width == fitz.Font('cour').text_length('iiiiiiii', fontsize=10.0)
+    assert wide_width > narrow_width
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from deepreview.tools.review_tools import _flatten_page_index, _search_lines
+
+
+def _rows(page_index: dict[int, list[str]]) -> list[tuple[int, int, str, str]]:
+    return [
+        (page, line_no, text, text.lower())
+        for page, line_no, text in _flatten_page_index(page_index)
+    ]
+
+
+PAGE_INDEX = {
+    2: [
+        'Results on the Graph benchmark',
+        'graph attention beats graph convolution',
+        'unrelated closing remark',
+    ],
+    1: [
+        'We propose a graph model.',
+        'Attention is computed per node.',
+        'Graph attention details follow.',
+    ],
+}
+
+
+def test_search_lines_ranks_by_token_count_then_page_and_line():
+    hits = _search_lines(_rows(PAGE_INDEX), 'Graph attention', 8)
+
+    assert [(hit['page'], hit['line'], hit['score']) for hit in hits] == [
+        (2, 2, 3),
+        (1, 3, 2),
+        (1, 1, 1),
+        (1, 2, 1),
+        (2, 1, 1),
+    ]
+    assert hits[0]['text'] == 'graph attention beats graph convolution'
+
+
+def test_search_lines_matches_partial_queries_and_caps_top_k():
+    hits = _search_lines(_rows(PAGE_INDEX), 'graph  missingtoken', 2)
+
+    assert [(hit['page'], hit['line'], hit['score']) for hit in hits] == [(2, 2, 2), (1, 1, 1)]
+    assert _search_lines(_rows(PAGE_INDEX), 'missingtoken', 8) == []
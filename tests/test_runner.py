@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import deepreview.runner as runner_module
+from deepreview.config import get_settings
+from deepreview.runner import _await_run_or_final_write, run_job
+from deepreview.storage import events_path, flush_events
+
+
+@pytest.fixture
+def job_id(monkeypatch, tmp_path):
+    monkeypatch.setenv('DATA_DIR', str(tmp_path / 'data'))
+    get_settings.cache_clear()
+    yield str(uuid4())
+    flush_events()
+    get_settings.cache_clear()
+
+
+def _event_names(job_id: str) -> list[str]:
+    flush_events()
+    path = events_path(job_id)
+    if not path.exists():
+        return []
+    return [json.loads(line)['event'] for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def _wait_for_run(job_id: str, run_body) -> tuple[object, bool]:
+    async def scenario():
+        runtime = SimpleNamespace(final_markdown_written=asyncio.Event(), final_markdown_text=None)
+
+        def write_final():
+            runtime.final_markdown_text = '# Report'
+            runtime.final_markdown_written.set()
+
+        run_task = asyncio.create_task(run_body(write_final))
+        result = await _await_run_or_final_write(job_id, runtime, run_task, attempt=1)
+        return result, run_task.cancelled()
+
+    return asyncio.run(scenario())
+
+
+def test_run_result_is_returned_when_run_finishes_first(job_id):
+    async def run(write_final):
+        return 'result'
+
+    assert _wait_for_run(job_id, run) == ('result', False)
+    assert _event_names(job_id) == []
+
+
+def test_run_failure_without_final_report_propagates(job_id):
+    async def run(write_final):
+        raise RuntimeError('model error')
+
+    with pytest.raises(RuntimeError, match='model error'):
+        _wait_for_run(job_id, run)
+
+
+def test_run_is_cancelled_when_final_write_lands_first(job_id):
+    async def run(write_final):
+        write_final()
+        await asyncio.sleep(60)
+
+    assert _wait_for_run(job_id, run) == (None, True)
+    assert _event_names(job_id) == ['agent_run_cancelled_after_final_write']
+
+
+def test_run_failure_after_final_write_is_ignored(job_id):
+    async def run(write_final):
+        write_final()
+        raise RuntimeError('late failure')
+
+    assert _wait_for_run(job_id, run) == (None, False)
+    assert _event_names(job_id) == ['agent_run_post_final_exception_ignored']
+
+
+def test_run_failing_while_cancelled_after_final_write_is_ignored(job_id):
+    async def run(write_final):
+        write_final()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            raise RuntimeError('cleanup failed') from None
+
+    assert _wait_for_run(job_id, run) == (None, False)
+    assert _event_names(job_id) == [
+        'agent_run_cancelled_after_final_write',
+        'agent_run_cancel_post_final_exception_ignored',
+    ]
+
+
+def test_failed_state_flush_does_not_mask_the_pipeline_error(job_id, monkeypatch):
+    async def failing_pipeline(_job_id):
+        raise RuntimeError('agent failed')
+
+    def failing_fallback(_job_id, *, warning):
+        raise ValueError('fallback failed')
+
+    def failing_flush():
+        raise OSError('disk full')
+
+    monkeypatch.setattr(runner_module, 'run_job_async', failing_pipeline)
+    monkeypatch.setattr(runner_module, '_complete_with_existing_final_report', failing_fallback)
+    monkeypatch.setattr(runner_module, 'flush_job_states', failing_flush)
+
+    with pytest.raises(ValueError, match='fallback failed'):
+        run_job(job_id)
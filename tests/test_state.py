@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import deepreview.state as state_module
+from deepreview.config import get_settings
+from deepreview.state import (
+    fail_job,
+    flush_job_states,
+    load_job_state,
+    mutate_job_state,
+    save_job_state,
+    set_status,
+    update_job_state,
+)
+from deepreview.storage import state_path
+from deepreview.types import JobState, JobStatus
+
+
+@pytest.fixture
+def buffered_state(monkeypatch, tmp_path):
+    monkeypatch.setenv('DATA_DIR', str(tmp_path / 'data'))
+    get_settings.cache_clear()
+    # Stop the background flusher so buffered writes only reach disk when a test flushes them.
+    monkeypatch.setattr(state_module, '_STATE_FLUSH_AUTOSTART', False)
+    state_module._stop_state_flusher()
+    flush_job_states()
+    yield
+    flush_job_states()
+    get_settings.cache_clear()
+
+
+def _new_job() -> JobState:
+    return save_job_state(JobState(title='t', source_pdf_name='paper.pdf'))
+
+
+def _disk_state(job: JobState) -> dict:
+    return json.loads(state_path(job.id).read_text(encoding='utf-8'))
+
+
+def test_non_terminal_updates_coalesce_and_load_sees_pending_bytes(buffered_state):
+    job = _new_job()
+
+    for idx in range(3):
+        set_status(job.id, JobStatus.agent_running, f'step {idx}')
+
+    assert _disk_state(job)['message'] == 'Job queued.'
+    assert list(state_module._PENDING_STATE_WRITES) == [state_path(job.id)]
+    assert load_job_state(job.id).message == 'step 2'
+
+    flush_job_states()
+
+    assert _disk_state(job)['message'] == 'step 2'
+    assert not state_module._PENDING_STATE_WRITES
+
+
+def test_returned_state_is_detached_from_the_cached_state(buffered_state):
+    job = _new_job()
+
+    returned = update_job_state(job.id, message='updated')
+    returned.message = 'changed by caller'
+    returned.metadata['leaked'] = True
+    mutated = mutate_job_state(job.id, lambda state: state.metadata.update(step=1))
+    mutated.metadata['leaked_again'] = True
+    set_status(job.id, JobStatus.agent_running, 'running')
+    flush_job_states()
+
+    disk = _disk_state(job)
+    assert disk['message'] == 'running'
+    assert disk['metadata'] == {'step': 1}
+
+
+def test_saved_job_is_not_shared_with_the_cache(buffered_state):
+    job = _new_job()
+    job.title = 'unsaved edit'
+
+    update_job_state(job.id, message='updated')
+    flush_job_states()
+
+    assert job.message == 'Job queued.'
+    assert _disk_state(job)['title'] == 't'
+    assert _disk_state(job)['message'] == 'updated'
+
+
+def test_terminal_status_is_written_immediately(buffered_state):
+    job = _new_job()
+    set_status(job.id, JobStatus.agent_running, 'running')
+
+    fail_job(job.id, message='Review pipeline failed.', error='boom')
+
+    disk = _disk_state(job)
+    assert disk['status'] == JobStatus.failed.value
+    assert disk['error'] == 'boom'
+    assert state_path(job.id) not in state_module._PENDING_STATE_WRITES
+
+
+def test_flush_keeps_entries_whose_write_failed(buffered_state, monkeypatch):
+    first = _new_job()
+    second = _new_job()
+    set_status(first.id, JobStatus.agent_running, 'first pending')
+    set_status(second.id, JobStatus.agent_running, 'second pending')
+
+    real_write = state_module.write_bytes_atomic
+    failing_path = state_path(first.id)
+
+    def flaky_write(path, data, **kwargs):
+        if path == failing_path:
+            raise OSError('disk full')
+        real_write(path, data, **kwargs)
+
+    monkeypatch.setattr(state_module, 'write_bytes_atomic', flaky_write)
+    with pytest.raises(OSError):
+        flush_job_states()
+
+    assert list(state_module._PENDING_STATE_WRITES) == [failing_path]
+    assert _disk_state(second)['message'] == 'second pending'
+
+    monkeypatch.setattr(state_module, 'write_bytes_atomic', real_write)
+    flush_job_states()
+
+    assert _disk_state(first)['message'] == 'first pending'
+    assert not state_module._PENDING_STATE_WRITES
+
+
+def test_flush_loop_backs_off_while_writes_keep_failing(buffered_state, monkeypatch, caplog):
+    attempts: list[float] = []
+
+    def failing_flush():
+        attempts.append(time.monotonic())
+        raise OSError('read-only file system')
+
+    monkeypatch.setattr(state_module, 'flush_job_states', failing_flush)
+    monkeypatch.setattr(state_module, '_STATE_FLUSH_INTERVAL_SECONDS', 0.001)
+    monkeypatch.setattr(state_module, '_STATE_FLUSH_MAX_RETRY_SECONDS', 0.016)
+    monkeypatch.setattr(state_module, '_STATE_FLUSH_WAKE', threading.Event())
+    stop = threading.Event()
+    flusher = threading.Thread(target=state_module._state_flush_loop, args=(stop,), daemon=True)
+
+    with caplog.at_level(logging.WARNING, logger=state_module.__name__):
+        state_module._STATE_FLUSH_WAKE.set()
+        flusher.start()
+        time.sleep(0.3)
+        stop.set()
+        state_module._STATE_FLUSH_WAKE.set()
+        flusher.join(timeout=5)
+
+    assert not flusher.is_alive()
+    # Without backoff the 1 ms interval would allow roughly 300 attempts.
+    assert 2 <= len(attempts) < 40
+    assert len(caplog.records) == 1
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import deepreview.storage as storage_module
+from deepreview.config import get_settings
+from deepreview.state import reset_job_dir
+from deepreview.storage import (
+    append_event,
+    close_events,
+    events_path,
+    flush_durability,
+    flush_events,
+    state_path,
+    write_bytes_atomic,
+)
+
+
+@pytest.fixture
+def data_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv('DATA_DIR', str(tmp_path / 'data'))
+    get_settings.cache_clear()
+    yield tmp_path / 'data'
+    flush_events()
+    get_settings.cache_clear()
+
+
+def _events(job_id: str) -> list[dict]:
+    return [json.loads(line) for line in events_path(job_id).read_text(encoding='utf-8').splitlines()]
+
+
+def test_events_are_written_in_order_per_job(data_dir):
+    first, second = str(uuid4()), str(uuid4())
+
+    for idx in range(50):
+        append_event(first, 'step', idx=idx)
+        append_event(second, 'step', idx=idx)
+    flush_events()
+
+    assert [row['idx'] for row in _events(first)] == list(range(50))
+    assert [row['idx'] for row in _events(second)] == list(range(50))
+    assert all(row['event'] == 'step' and row['ts'] for row in _events(first))
+
+
+def test_close_events_releases_the_open_handle(data_dir):
+    job_id = str(uuid4())
+    append_event(job_id, 'before')
+    close_events(job_id)
+
+    # A handle still cached after close_events would keep appending to the unlinked file.
+    events_path(job_id).unlink()
+    append_event(job_id, 'after')
+    flush_events()
+
+    assert [row['event'] for row in _events(job_id)] == ['after']
+
+
+def test_reset_job_dir_drops_queued_events_but_keeps_job_json(data_dir):
+    job_id = str(uuid4())
+    write_bytes_atomic(state_path(job_id), b'{}')
+    for idx in range(10):
+        append_event(job_id, 'old', idx=idx)
+
+    reset_job_dir(job_id)
+    append_event(job_id, 'new')
+    flush_events()
+
+    assert [row['event'] for row in _events(job_id)] == ['new']
+    assert state_path(job_id).read_bytes() == b'{}'
+
+
+def test_flush_durability_syncs_and_drains_dirty_dirs(data_dir, monkeypatch):
+    # Stop the background syncer so only the explicit flushes below drain the set.
+    monkeypatch.setattr(storage_module, '_DIR_SYNC_AUTOSTART', False)
+    storage_module._stop_dir_syncer()
+    flush_durability()
+    synced: list[Path] = []
+    monkeypatch.setattr(storage_module, '_fsync_dir', synced.append)
+    job_id = str(uuid4())
+
+    write_bytes_atomic(state_path(job_id), b'{}')
+    write_bytes_atomic(state_path(job_id), b'{"a": 1}')
+    write_bytes_atomic(events_path(job_id).with_name('regenerable.txt'), b'x', durable=False)
+
+    assert storage_module._DIRTY_DIRS == {state_path(job_id).parent}
+    flush_durability()
+
+    assert synced == [state_path(job_id).parent]
+    assert not storage_module._DIRTY_DIRS